@@ -8,6 +8,7 @@ import json
 from pathlib import Path
 from collections import defaultdict, Counter
 import sys
+import numpy as np
 
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
@@ -37,15 +38,27 @@ def extract_job_skills(offer):
     
     return set(skills)
 
-def calculate_similarity(skills1, skills2):
-    """Calculate Jaccard similarity between two skill sets"""
-    if not skills1 or not skills2:
-        return 0
+def compute_similarity_matrix(offer_skills):
+    """
+    Compute pairwise Jaccard similarity between all skill sets at once.
+    Intersections come from a single product of the binary skill matrix,
+    unions from the set sizes.
+    """
+    skill_to_idx = {}
+    rows, cols = [], []
+    for row, skills in enumerate(offer_skills):
+        for skill in skills:
+            rows.append(row)
+            cols.append(skill_to_idx.setdefault(skill, len(skill_to_idx)))
+    
+    membership = np.zeros((len(offer_skills), len(skill_to_idx)))
+    membership[rows, cols] = 1
     
-    intersection = len(skills1 & skills2)
-    union = len(skills1 | skills2)
+    intersection = membership @ membership.T
+    sizes = membership.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
     
-    return intersection / union if union > 0 else 0
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
 
 def cluster_jobs_by_skills(offers, min_similarity=0.3):
     """
@@ -61,6 +74,8 @@ def cluster_jobs_by_skills(offers, min_similarity=0.3):
         skills = extract_job_skills(offer)
         offer_skills.append(skills)
     
+    similarity = compute_similarity_matrix(offer_skills)
+    
     # Initialize clusters - each job starts in its own cluster
     clusters = {i: [i] for i in range(len(offers))}
     cluster_id = len(offers)
@@ -87,13 +102,7 @@ def cluster_jobs_by_skills(offers, min_similarity=0.3):
                 c1_jobs = clusters[c1_id]
                 c2_jobs = clusters[c2_id]
                 
-                similarities = []
-                for idx1 in c1_jobs:
-                    for idx2 in c2_jobs:
-                        sim = calculate_similarity(offer_skills[idx1], offer_skills[idx2])
-                        similarities.append(sim)
-                
-                avg_similarity = sum(similarities) / len(similarities) if similarities else 0
+                avg_similarity = similarity[np.ix_(c1_jobs, c2_jobs)].mean()
                 
                 # Merge if similarity is high enough
                 if avg_similarity >= min_similarity:
@@ -13,7 +13,7 @@ os.chdir(str(skill_extractor_dir))
 
 # Import modules
 try:
-    from nlp.advanced_skills_extractor import SkillsExtractor
+    from nlp.advanced_skills_extractor import get_skills_extractor
     from nlp.text_cleaner import TextCleaner
     from recommendtion.clustering_recommender import SkillsRecommender
 except ImportError as e:
@@ -74,7 +74,7 @@ def load_extractors():
     """Load NLP extractors"""
     return {
         'text_cleaner': TextCleaner(),
-        'skills_extractor': SkillsExtractor(),
+        'skills_extractor': get_skills_extractor(),
     }
 
 extractors = load_extractors()
@@ -73,15 +73,14 @@ class SkillsVectorizer:
         n_offers = len(offers)
         n_skills = len(skill_list)
 
-        # Créer une matrice binaire (1 si la compétence est présente)
-        matrix = np.zeros((n_offers, n_skills))
+        # Créer une matrice binaire préallouée (1 si la compétence est présente)
+        skill_to_idx = {skill: i for i, skill in enumerate(skill_list)}
+        matrix = np.zeros((n_offers, n_skills), dtype=np.uint8)
 
         for idx, offer in enumerate(offers):
             if "extracted_skills" in offer:
                 for skill in offer["extracted_skills"]:
-                    if skill in skill_list:
-                        col_idx = skill_list.index(skill)
-                        matrix[idx, col_idx] = 1
+                    matrix[idx, skill_to_idx[skill]] = 1
 
         logger.info(f"Matrice des compétences: {matrix.shape}")
         return matrix
@@ -186,8 +185,8 @@ def cluster_offers(offers: List[Dict]) -> Dict:
     clusterer.fit(embeddings)
 
     # Ajouter les labels aux offres
-    for idx, offer in enumerate(offers):
-        offer["cluster"] = int(clusterer.labels[idx])
+    for offer, label in zip(offers, clusterer.labels.tolist()):
+        offer["cluster"] = label
 
     # Statistiques par cluster
     logger.info("Étape 3: Statistiques...")
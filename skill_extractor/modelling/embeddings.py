@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 class GeminiEmbedder:
     """Génère des embeddings avec l'API Google Gemini."""
 
+    MODEL = "models/embedding-001"
+    BATCH_SIZE = 100  # nombre max de textes par requête embed_content
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialise l'embedder Gemini."""
         from dotenv import load_dotenv
@@ -38,33 +41,52 @@ class GeminiEmbedder:
             raise RuntimeError(f"Erreur Gemini: {e}")
 
     def encode(self, texts: List[str]) -> np.ndarray:
-        """Génère les embeddings."""
+        """Génère les embeddings (un appel API par lot de BATCH_SIZE textes)."""
         logger.info(f"Embeddings Gemini pour {len(texts)} textes...")
         embeddings = []
         
-        for i, text in enumerate(texts):
-            if (i + 1) % 10 == 0:
-                logger.info(f"  {i + 1}/{len(texts)} traités...")
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            batch = texts[start:start + self.BATCH_SIZE]
             
             try:
                 response = self.genai.embed_content(
-                    model="models/embedding-001",
-                    content=text,
+                    model=self.MODEL,
+                    content=batch,
                     task_type="retrieval_document"
                 )
-                embeddings.append(response['embedding'])
+                embeddings.extend(response['embedding'])
             except Exception as e:
-                logger.warning(f"Erreur texte {i}: {e}")
-                embeddings.append([0] * 768)
+                logger.warning(f"Erreur lot {start}-{start + len(batch) - 1}: {e}")
+                embeddings.extend(self._encode_one_by_one(batch, start))
+            
+            logger.info(f"  {start + len(batch)}/{len(texts)} traités...")
         
         result = np.array(embeddings, dtype=np.float32)
         logger.info(f"✓ {result.shape}")
         return result
 
+    def _encode_one_by_one(self, batch: List[str], offset: int) -> List[List[float]]:
+        """Repli texte par texte pour isoler le(s) texte(s) en erreur d'un lot."""
+        embeddings = []
+        for i, text in enumerate(batch, start=offset):
+            try:
+                response = self.genai.embed_content(
+                    model=self.MODEL,
+                    content=text,
+                    task_type="retrieval_document"
+                )
+                embeddings.append(response['embedding'])
+            except Exception as e:
+                logger.warning(f"Erreur texte {i}: {e}")
+                embeddings.append([0] * 768)
+        return embeddings
+
 
 class SentenceTransformerEmbedder:
     """Utilise sentence-transformers."""
 
+    BATCH_SIZE = 64
+
     def __init__(self):
         """Initialise le modèle."""
         try:
@@ -80,7 +102,12 @@ class SentenceTransformerEmbedder:
     def encode(self, texts: List[str]) -> np.ndarray:
         """Génère les embeddings."""
         logger.info(f"sentence-transformers pour {len(texts)} textes...")
-        embeddings = self.model.encode(texts, show_progress_bar=False)
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
         return embeddings.astype(np.float32)
 
 
@@ -6,12 +6,13 @@ NLP Module pour traitement des offres d'emploi.
 """
 
 from .text_cleaner import TextCleaner, get_cleaner
-from .advanced_skills_extractor import SkillsExtractor
+from .advanced_skills_extractor import SkillsExtractor, get_skills_extractor
 from .nlp_pipeline import NLPPipeline
 
 __all__ = [
     'TextCleaner',
     'get_cleaner',
     'SkillsExtractor',
+    'get_skills_extractor',
     'NLPPipeline',
 ]
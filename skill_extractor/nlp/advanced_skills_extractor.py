@@ -3,6 +3,7 @@ Advanced Skills Extraction with validation
 Uses multiple strategies to ensure only real tech skills are extracted
 """
 
+import hashlib
 import json
 import re
 from pathlib import Path
@@ -10,6 +11,24 @@ from typing import List, Dict, Set, Tuple
 from difflib import SequenceMatcher
 import numpy as np
 
+try:
+    import ahocorasick  # pyahocorasick (C extension), optional
+except ImportError:
+    ahocorasick = None
+
+
+def _is_word_char(char: str) -> bool:
+    """Same definition as regex \\w for str patterns"""
+    return char.isalnum() or char == '_'
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Equivalent of regex \\b at position index of text"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
 class SkillsExtractor:
     """Advanced skills extraction engine with validation"""
     
@@ -97,11 +116,92 @@ class SkillsExtractor:
         'secrétaire', 'secretary', 'receptionist', 'accueil'
     }
     
+    # Common spelling variations (canonical skill -> variants), used by _fuzzy_match_skills
+    SKILL_VARIATIONS = {
+        'node.js': ['nodejs', 'node js', 'node.js'],
+        'c++': ['c plus plus', 'cpp'],
+        'c#': ['c sharp', 'csharp'],
+        '.net': ['dotnet', '.net core', 'dotnetcore'],
+        'react': ['reactjs', 'react.js'],
+        'angular': ['angularjs', 'angular.js'],
+        'vue.js': ['vuejs', 'vue js'],
+        'asp.net': ['aspnet', 'asp net'],
+        'github': ['git hub', 'github actions'],
+        'gitlab': ['git lab'],
+        'rest api': ['restapi', 'rest-api'],
+        'graphql': ['graph ql'],
+        'ci/cd': ['cicd', 'ci-cd', 'continuous integration'],
+    }
+    
+    # À incrémenter quand la logique d'extraction change sans toucher au vocabulaire
+    EXTRACTION_VERSION = 1
+    
+    @classmethod
+    def fingerprint(cls) -> str:
+        """
+        Empreinte (BLAKE2b) de la version d'extraction et du vocabulaire.
+        
+        Change dès qu'une skill, une variante ou un mot-clé exclu change:
+        sert à invalider les résultats d'extraction mis en cache.
+        """
+        vocabulary = {
+            'version': cls.EXTRACTION_VERSION,
+            'skills': {category: sorted(skills) for category, skills in cls.TECH_SKILLS_DB.items()},
+            'non_tech_keywords': sorted(cls.NON_TECH_KEYWORDS),
+            'non_tech_job_titles': sorted(cls.NON_TECH_JOB_TITLES),
+            'variations': cls.SKILL_VARIATIONS,
+        }
+        payload = json.dumps(vocabulary, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+    
     def __init__(self):
         # Build flat skill set for easier lookup
         self.all_skills_flat = set()
         for category in self.TECH_SKILLS_DB.values():
             self.all_skills_flat.update(category)
+        self._non_tech_lower = frozenset(k.lower() for k in self.NON_TECH_KEYWORDS)
+        
+        # Multi-pattern matcher built once: one linear scan per text instead of one regex per skill
+        self._automaton = self._build_automaton() if ahocorasick is not None else None
+        self._skill_patterns = None
+        if self._automaton is None:
+            self._skill_patterns = [
+                (skill, re.compile(r'\b' + re.escape(skill) + r'\b', re.IGNORECASE))
+                for skill in sorted(self.all_skills_flat)
+            ]
+    
+    def _build_automaton(self):
+        """Aho-Corasick automaton over lowercased skills -> (length, canonical skills)"""
+        by_key = {}
+        for skill in sorted(self.all_skills_flat):
+            by_key.setdefault(skill.lower(), []).append(skill)
+        
+        automaton = ahocorasick.Automaton()
+        for key, skills in by_key.items():
+            automaton.add_word(key, (len(key), tuple(skills)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_skills(self, text: str, lowered: bool = False) -> List[str]:
+        """
+        Skills matching r'\\b<skill>\\b' (case-insensitive) in text, in order of first occurrence.
+        
+        lowered=True: text est déjà en minuscules (pas de second lower()).
+        """
+        if not text:
+            return []
+        
+        if self._automaton is None:
+            return [skill for skill, pattern in self._skill_patterns if pattern.search(text)]
+        
+        text_lower = text if lowered else text.lower()
+        found = {}
+        for end, (length, skills) in self._automaton.iter(text_lower):
+            start = end - length + 1
+            if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, end + 1):
+                for skill in skills:
+                    found.setdefault(skill)
+        return list(found)
     
     def is_tech_job(self, title: str, description: str) -> bool:
         """Determine if a job is actually tech-related"""
@@ -138,12 +238,8 @@ class SkillsExtractor:
         text_lower = text.lower()
         found_skills = []
         
-        # Strategy 1: Exact matches (case-insensitive)
-        for skill in self.all_skills_flat:
-            # Create word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                found_skills.append(skill)
+        # Strategy 1: Exact matches (case-insensitive, word boundaries)
+        found_skills.extend(self._find_skills(text_lower, lowered=True))
         
         # Remove duplicates while preserving order
         found_skills = list(dict.fromkeys(found_skills))
@@ -154,7 +250,7 @@ class SkillsExtractor:
         # Remove duplicates and non-tech
         found_skills = list(dict.fromkeys(found_skills))
         found_skills = [s for s in found_skills 
-                       if s.lower() not in [k.lower() for k in self.NON_TECH_KEYWORDS]]
+                       if s.lower() not in self._non_tech_lower]
         
         return found_skills
     
@@ -170,50 +266,36 @@ class SkillsExtractor:
         if not description:
             return [], []
         
+        # Texte mis en minuscules une seule fois; sections et recherche travaillent dessus
         desc_lower = description.lower()
+        lines_lower = desc_lower.split('\n')
         skill_weights = {}
         
         # SECTION 1: Technical Skills section (highest weight = 3.0)
         tech_keywords = ['compétences', 'skills', 'technical', 'required skills', 'technology']
-        tech_section = self._extract_section_content(description, tech_keywords)
+        tech_section = self._section_lines(lines_lower, tech_keywords)
         
         # SECTION 2: Profile section (medium weight = 2.0)
         profile_keywords = ['profil', 'profile', 'recherché', 'required', 'looking for', 'qualifications']
-        profile_section = self._extract_section_content(description, profile_keywords)
+        profile_section = self._section_lines(lines_lower, profile_keywords)
         
         # SECTION 3: Responsibilities section (lower weight = 1.5)
         resp_keywords = ['responsabilités', 'responsibilities', 'missions', 'you will', 'rôle']
-        resp_section = self._extract_section_content(description, resp_keywords)
+        resp_section = self._section_lines(lines_lower, resp_keywords)
         
         # Extract skills from each section with different weights
-        if tech_section:
-            for skill in self.all_skills_flat:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, tech_section, re.IGNORECASE):
-                    skill_weights[skill] = skill_weights.get(skill, 0) + 3.0
-        
-        if profile_section:
-            for skill in self.all_skills_flat:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, profile_section, re.IGNORECASE):
-                    skill_weights[skill] = skill_weights.get(skill, 0) + 2.0
-        
-        if resp_section:
-            for skill in self.all_skills_flat:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, resp_section, re.IGNORECASE):
-                    skill_weights[skill] = skill_weights.get(skill, 0) + 1.5
+        for section, weight in ((tech_section, 3.0), (profile_section, 2.0), (resp_section, 1.5)):
+            for skill in self._find_skills('\n'.join(section), lowered=True):
+                skill_weights[skill] = skill_weights.get(skill, 0) + weight
         
         # Also search in full description with weight 1.0
-        for skill in self.all_skills_flat:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, desc_lower, re.IGNORECASE):
-                skill_weights[skill] = skill_weights.get(skill, 0) + 1.0
+        for skill in self._find_skills(desc_lower, lowered=True):
+            skill_weights[skill] = skill_weights.get(skill, 0) + 1.0
         
         # Filter non-tech and sort by weight
         filtered_skills = [
             (skill, weight) for skill, weight in skill_weights.items()
-            if skill.lower() not in [k.lower() for k in self.NON_TECH_KEYWORDS]
+            if skill.lower() not in self._non_tech_lower
         ]
         
         # Sort by weight (descending)
@@ -226,44 +308,29 @@ class SkillsExtractor:
     def _extract_section_content(self, text: str, section_keywords: List[str], context_lines: int = 15) -> str:
         """Extract content of a specific section based on keywords"""
         lines = text.split('\n')
-        section_content = []
-        in_section = False
-        
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
+        start, stop = self._section_bounds(text.lower().split('\n'), section_keywords, context_lines)
+        return '\n'.join(lines[start:stop])
+    
+    @staticmethod
+    def _section_bounds(lines_lower: List[str], section_keywords: List[str], context_lines: int = 15) -> Tuple[int, int]:
+        """Bornes [start, stop) des lignes qui suivent le premier header trouvé (vide si aucun)"""
+        for i, line_lower in enumerate(lines_lower):
             # Check if this line contains section header
             if any(keyword in line_lower for keyword in section_keywords):
-                in_section = True
                 # Get next context_lines lines after header
-                for j in range(i+1, min(i+context_lines, len(lines))):
-                    section_content.append(lines[j])
-                break
-        
-        return '\n'.join(section_content)
+                return i + 1, min(i + context_lines, len(lines_lower))
+        return 0, 0
+    
+    def _section_lines(self, lines_lower: List[str], section_keywords: List[str], context_lines: int = 15) -> List[str]:
+        """Lignes (déjà en minuscules) de la section, comme _extract_section_content"""
+        start, stop = self._section_bounds(lines_lower, section_keywords, context_lines)
+        return lines_lower[start:stop]
     
     def _fuzzy_match_skills(self, text: str) -> List[str]:
         """Fuzzy matching for skill variations"""
         fuzzy_matches = []
         
-        # Common variations
-        variations = {
-            'node.js': ['nodejs', 'node js', 'node.js'],
-            'c++': ['c plus plus', 'cpp'],
-            'c#': ['c sharp', 'csharp'],
-            '.net': ['dotnet', '.net core', 'dotnetcore'],
-            'react': ['reactjs', 'react.js'],
-            'angular': ['angularjs', 'angular.js'],
-            'vue.js': ['vuejs', 'vue js'],
-            'asp.net': ['aspnet', 'asp net'],
-            'github': ['git hub', 'github actions'],
-            'gitlab': ['git lab'],
-            'rest api': ['restapi', 'rest-api'],
-            'graphql': ['graph ql'],
-            'ci/cd': ['cicd', 'ci-cd', 'continuous integration'],
-        }
-        
-        for skill, variation_list in variations.items():
+        for skill, variation_list in self.SKILL_VARIATIONS.items():
             for variation in variation_list:
                 if variation in text:
                     fuzzy_matches.append(skill)
@@ -285,10 +352,21 @@ class SkillsExtractor:
         return is_tech, skills
 
 
+# Instance globale (vocabulaire et automate construits une seule fois par processus)
+_skills_extractor = None
+
+def get_skills_extractor() -> SkillsExtractor:
+    """Obtient l'instance globale du SkillsExtractor."""
+    global _skills_extractor
+    if _skills_extractor is None:
+        _skills_extractor = SkillsExtractor()
+    return _skills_extractor
+
+
 def process_jobs_with_advanced_extraction(input_file: str, output_file: str) -> None:
     """Process all jobs with advanced extraction"""
     
-    extractor = SkillsExtractor()
+    extractor = get_skills_extractor()
     
     # Load original data
     with open(input_file, 'r', encoding='utf-8') as f:
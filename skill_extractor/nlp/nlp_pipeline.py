@@ -3,20 +3,94 @@ Pipeline NLP complet pour traiter les offres d'emploi.
 Combine nettoyage de texte + extraction de compétences.
 """
 
+import hashlib
 import logging
+import os
 import sys
-import json
-from typing import List, Dict, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator, Callable, MutableMapping
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+import orjson
+
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 
 from .text_cleaner import TextCleaner
-from .advanced_skills_extractor import SkillsExtractor
+from .advanced_skills_extractor import SkillsExtractor, get_skills_extractor
 
 logger = logging.getLogger(__name__)
 
+# Une ligne de progression toutes les PROGRESS_LOG_EVERY offres (pas une par offre)
+PROGRESS_LOG_EVERY = 500
+
+# Champs calculés par process_single_job qui ne dépendent que du titre et de la description
+CACHED_FIELDS = ('description_cleaned', 'title_cleaned', 'skills', 'skills_weighted', 'num_skills')
+# À incrémenter quand le nettoyage (TextCleaner) ou le format de CACHED_FIELDS change
+CACHE_VERSION = 1
+
+
+def skills_cache_fingerprint() -> str:
+    """
+    Empreinte du cache de skills: version du cache + vocabulaire/version du SkillsExtractor.
+    
+    À inclure dans le chemin du cache: un extracteur modifié ouvre un cache neuf
+    au lieu de resservir les skills calculées par l'ancien.
+    """
+    return f"v{CACHE_VERSION}_{SkillsExtractor.fingerprint()}"
+
+
+def job_cache_key(job: Dict) -> str:
+    """Empreinte (BLAKE2b) du titre + description d'une offre, clé du cache de skills."""
+    text = f"{job.get('title', '')}\x00{job.get('description', '')}"
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SkillStatistics:
+    """
+    Statistiques de skills accumulées offre par offre.
+    
+    Seuls les compteurs par skill sont gardés (mémoire en O(skills uniques)),
+    ce qui permet de les calculer pendant l'écriture d'un flux d'offres.
+    """
+
+    def __init__(self):
+        self.total_jobs = 0
+        self.jobs_with_skills = 0
+        self.skill_counts = Counter()
+
+    def add(self, job: Dict):
+        """Compte une offre traitée."""
+        self.total_jobs += 1
+        skills = job.get('skills')
+        if skills:
+            self.jobs_with_skills += 1
+            self.skill_counts.update(skills)
+
+    def summary(self) -> Dict:
+        """Retourne le dict de statistiques (format de NLPPipeline.get_statistics)."""
+        skills = sorted(self.skill_counts)
+        counts = np.fromiter((self.skill_counts[skill] for skill in skills), dtype=np.int64, count=len(skills))
+        
+        # Top 20 skills (argpartition puis tri du sous-ensemble; égalités par nom)
+        top_idx = np.arange(len(skills))
+        if len(skills) > 20:
+            top_idx = np.argpartition(-counts, 19)[:20]
+        top_idx = top_idx[np.lexsort((top_idx, -counts[top_idx]))]
+        top_skills = [(skills[i], int(counts[i])) for i in top_idx.tolist()]
+        
+        total_jobs = self.total_jobs
+        return {
+            'total_jobs': total_jobs,
+            'jobs_with_skills': self.jobs_with_skills,
+            'coverage': round((self.jobs_with_skills / total_jobs * 100) if total_jobs > 0 else 0, 2),
+            'total_unique_skills': len(skills),
+            'top_20_skills': top_skills,
+        }
+
 
 class NLPPipeline:
     """Pipeline NLP complet pour traitement des offres d'emploi."""
@@ -24,7 +98,7 @@ class NLPPipeline:
     def __init__(self):
         """Initialise le pipeline NLP."""
         self.cleaner = TextCleaner()
-        self.skill_extractor = SkillsExtractor()
+        self.skill_extractor = get_skills_extractor()
         logger.info("NLPPipeline initialized with TextCleaner and SkillsExtractor")
 
     def process_job_offers(self, jobs: List[Dict]) -> List[Dict]:
@@ -43,94 +117,170 @@ class NLPPipeline:
         
         processed_jobs = []
         
-        for idx, job in enumerate(jobs):
-            try:
-                # Copier le job original
-                processed_job = job.copy()
-                
-                # 1. Nettoyage du texte
-                description = job.get('description', '')
-                title = job.get('title', '')
-                
-                if description:
-                    cleaned_desc = self.cleaner.clean(description, remove_stopwords=False)
-                    processed_job['description_cleaned'] = cleaned_desc
-                else:
-                    cleaned_desc = ""
-                    processed_job['description_cleaned'] = ""
-                
-                if title:
-                    cleaned_title = self.cleaner.clean(title, remove_stopwords=False)
-                    processed_job['title_cleaned'] = cleaned_title
-                else:
-                    cleaned_title = ""
-                    processed_job['title_cleaned'] = ""
-                
-                # 2. Extraction des compétences (utiliser texte original + title)
-                combined_text = f"{title} {description}"
-                
-                # Extraire skills avec la méthode pondérée qui exploite les sections
-                extracted_skills, weighted_skills = self.skill_extractor.extract_skills_weighted(
-                    description=combined_text,
-                    title=title
-                )
-                
-                # Garder les skills dans un format structuré
-                processed_job['skills'] = extracted_skills
-                processed_job['skills_weighted'] = [
-                    {"skill": skill, "weight": float(weight)} 
-                    for skill, weight in weighted_skills
-                ][:20]  # Garder top 20
-                processed_job['num_skills'] = len(extracted_skills)
-                processed_job['processed_at'] = datetime.now().isoformat()
-                
-                processed_jobs.append(processed_job)
-                
-                if (idx + 1) % 10 == 0:
-                    logger.info(f"  Processed {idx + 1}/{len(jobs)} jobs...")
-                
-            except Exception as e:
-                logger.error(f"Error processing job {idx}: {e}")
-                processed_jobs.append(job)
+        for idx, job in enumerate(jobs, 1):
+            processed_jobs.append(self._process_job_safe(job))
+            
+            if idx % PROGRESS_LOG_EVERY == 0:
+                logger.info(f"  Processed {idx}/{len(jobs)} jobs...")
         
         logger.info(f"Processing complete. {len(processed_jobs)} jobs processed.")
         return processed_jobs
 
-    def get_statistics(self, processed_jobs: List[Dict]) -> Dict:
+    def iter_process_job_offers(self, jobs: Iterable[Dict], batch_size: int = 256,
+                                max_workers: Optional[int] = None,
+                                cache: Optional[MutableMapping] = None) -> Iterator[Dict]:
+        """
+        Traite un flux d'offres (ex: ijson) par lots, sans le charger en entier.
+        
+        Seul un lot de batch_size offres est en mémoire à la fois. Si le premier
+        lot est incomplet (petit fichier), tout est traité séquentiellement;
+        sinon les lots passent par un pool de processus unique.
+        
+        Args:
+            jobs: Itérable d'offres brutes
+            batch_size: Nombre d'offres lues par lot
+            max_workers: Nombre de processus (défaut: os.cpu_count())
+            cache: Mapping persistant (ex: shelve) job_cache_key -> CACHED_FIELDS;
+                les offres déjà vues ne sont pas retraitées
+        
+        Yields:
+            Offres traitées, dans l'ordre d'entrée
+        """
+        jobs = iter(jobs)
+        batch = list(islice(jobs, batch_size))
+        processed = 0
+        
+        if len(batch) < batch_size or max_workers == 1:
+            def process_serially(misses):
+                return map(self._process_job_safe, misses)
+            
+            while batch:
+                yield from self._process_batch_cached(batch, process_serially, cache)
+                processed += len(batch)
+                logger.info(f"  Processed {processed} jobs...")
+                batch = list(islice(jobs, batch_size))
+            return
+        
+        max_workers = max_workers or os.cpu_count()
+        logger.info(f"Streaming job offers on {max_workers} processes (batches of {batch_size})...")
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            def process_on_pool(misses):
+                chunksize = max(1, len(misses) // max_workers)
+                return executor.map(_process_job_in_worker, misses, chunksize=chunksize)
+            
+            while batch:
+                yield from self._process_batch_cached(batch, process_on_pool, cache)
+                processed += len(batch)
+                logger.info(f"  Processed {processed} jobs...")
+                batch = list(islice(jobs, batch_size))
+
+    def _process_batch_cached(self, batch: List[Dict], process: Callable[[List[Dict]], Iterable[Dict]],
+                              cache: Optional[MutableMapping]) -> List[Dict]:
+        """
+        Traite un lot en ne passant à process que les offres absentes du cache.
+        
+        Les offres en échec (renvoyées brutes, sans processed_at) ne sont pas mises en cache.
+        """
+        if cache is None:
+            return list(process(batch))
+        
+        keys = [job_cache_key(job) for job in batch]
+        results = [None] * len(batch)
+        misses = []
+        for i, (job, key) in enumerate(zip(batch, keys)):
+            fields = cache.get(key)
+            if fields is None:
+                misses.append(i)
+                continue
+            processed_job = job.copy()
+            processed_job.update(fields)
+            processed_job['processed_at'] = datetime.now().isoformat()
+            results[i] = processed_job
+        
+        if misses:
+            for i, processed_job in zip(misses, process([batch[i] for i in misses])):
+                results[i] = processed_job
+                if 'processed_at' in processed_job:
+                    cache[keys[i]] = {field: processed_job[field] for field in CACHED_FIELDS}
+        
+        if len(misses) < len(batch):
+            logger.info(f"  {len(batch) - len(misses)}/{len(batch)} jobs served from skills cache")
+        return results
+
+    def _process_job_safe(self, job: Dict) -> Dict:
+        """Traite une offre; en cas d'erreur, l'offre brute est renvoyée."""
+        try:
+            return self.process_single_job(job)
+        except Exception as e:
+            logger.error(f"Error processing job {job.get('title', '')!r}: {e}")
+            return job
+
+    def process_single_job(self, job: Dict) -> Dict:
+        """
+        Nettoie une offre et extrait ses compétences.
+        
+        Args:
+            job: Offre brute
+        
+        Returns:
+            Copie de l'offre avec textes nettoyés et skills
+        """
+        # Copier le job original
+        processed_job = job.copy()
+        
+        # 1. Nettoyage du texte
+        description = job.get('description', '')
+        title = job.get('title', '')
+        
+        if description:
+            cleaned_desc = self.cleaner.clean(description, remove_stopwords=False)
+            processed_job['description_cleaned'] = cleaned_desc
+        else:
+            cleaned_desc = ""
+            processed_job['description_cleaned'] = ""
+        
+        if title:
+            cleaned_title = self.cleaner.clean(title, remove_stopwords=False)
+            processed_job['title_cleaned'] = cleaned_title
+        else:
+            cleaned_title = ""
+            processed_job['title_cleaned'] = ""
+        
+        # 2. Extraction des compétences (utiliser texte original + title)
+        combined_text = f"{title} {description}"
+        
+        # Extraire skills avec la méthode pondérée qui exploite les sections
+        extracted_skills, weighted_skills = self.skill_extractor.extract_skills_weighted(
+            description=combined_text,
+            title=title
+        )
+        
+        # Garder les skills dans un format structuré
+        processed_job['skills'] = extracted_skills
+        processed_job['skills_weighted'] = [
+            {"skill": skill, "weight": float(weight)} 
+            for skill, weight in weighted_skills
+        ][:20]  # Garder top 20
+        processed_job['num_skills'] = len(extracted_skills)
+        processed_job['processed_at'] = datetime.now().isoformat()
+        
+        return processed_job
+
+    def get_statistics(self, processed_jobs: Iterable[Dict]) -> Dict:
         """
         Retourne des statistiques sur les offres traitées.
         
         Args:
-            processed_jobs: Offres avec skills extraits
+            processed_jobs: Offres avec skills extraits (liste ou flux, lu une fois)
         
         Returns:
             Dict avec statistiques
         """
-        total_jobs = len(processed_jobs)
-        jobs_with_skills = sum(1 for job in processed_jobs if job.get('skills'))
-        total_unique_skills = set()
-        skills_frequency = {}
-        
+        statistics = SkillStatistics()
         for job in processed_jobs:
-            if 'skills' in job and job['skills']:
-                for skill in job['skills']:
-                    total_unique_skills.add(skill)
-                    skills_frequency[skill] = skills_frequency.get(skill, 0) + 1
-        
-        # Top 20 skills
-        top_skills = sorted(
-            skills_frequency.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:20]
-        
-        return {
-            'total_jobs': total_jobs,
-            'jobs_with_skills': jobs_with_skills,
-            'coverage': round((jobs_with_skills / total_jobs * 100) if total_jobs > 0 else 0, 2),
-            'total_unique_skills': len(total_unique_skills),
-            'top_20_skills': top_skills,
-        }
+            statistics.add(job)
+        return statistics.summary()
 
     def save_processed_jobs(self, processed_jobs: List[Dict], output_path: str):
         """
@@ -146,11 +296,35 @@ class NLPPipeline:
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
         # Sauvegarder en JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(processed_jobs, f, ensure_ascii=False, indent=2)
+        Path(output_path).write_bytes(orjson.dumps(processed_jobs, option=orjson.OPT_INDENT_2))
         
         logger.info(f"✅ Saved {len(processed_jobs)} processed jobs to {output_path}")
 
+    def save_processed_jobs_stream(self, processed_jobs: Iterable[Dict], output_path: str) -> int:
+        """
+        Écrit les offres traitées au fil de l'eau dans un tableau JSON.
+        
+        Args:
+            processed_jobs: Itérable d'offres traitées (consommé une seule fois)
+            output_path: Chemin du fichier JSON de sortie
+        
+        Returns:
+            Nombre d'offres écrites
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        count = 0
+        with open(output_path, 'wb') as f:
+            f.write(b'[')
+            for job in processed_jobs:
+                f.write(b',\n' if count else b'\n')
+                f.write(orjson.dumps(job))
+                count += 1
+            f.write(b'\n]\n')
+        
+        logger.info(f"✅ Saved {count} processed jobs to {output_path}")
+        return count
+
 
 def process_json_file(input_json: str, output_json: str) -> Dict:
     """
@@ -166,8 +340,7 @@ def process_json_file(input_json: str, output_json: str) -> Dict:
     logger.info(f"Loading jobs from {input_json}...")
     
     # Charger les offres
-    with open(input_json, 'r', encoding='utf-8') as f:
-        jobs = json.load(f)
+    jobs = orjson.loads(Path(input_json).read_bytes())
     
     logger.info(f"Loaded {len(jobs)} jobs")
     
@@ -196,6 +369,20 @@ def process_json_file(input_json: str, output_json: str) -> Dict:
     return stats
 
 
+# Pipeline propre à chaque worker du pool (construit une fois par processus)
+_worker_pipeline = None
+
+def _init_worker():
+    """Initializer du ProcessPoolExecutor: charge cleaner + extracteur une seule fois."""
+    global _worker_pipeline
+    _worker_pipeline = NLPPipeline()
+
+
+def _process_job_in_worker(job: Dict) -> Dict:
+    """Traite une offre dans un worker (offre brute renvoyée en cas d'erreur)."""
+    return _worker_pipeline._process_job_safe(job)
+
+
 # Instance globale
 _nlp_pipeline = None
 
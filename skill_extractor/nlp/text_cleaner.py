@@ -3,17 +3,34 @@ Module NLP pour le nettoyage et la préparation des textes.
 Nettoie les descriptions d'offres d'emploi pour l'extraction de compétences.
 """
 
+import html
 import re
 import logging
 import sys
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from joblib import Parallel, delayed
 
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 
 logger = logging.getLogger(__name__)
 
+# Motifs compilés une seule fois (URLs et emails gardent deux passes: une
+# alternation unique exige des lookaheads par caractère, plus lente en re)
+_URLS_RE = re.compile(r"http\S+|www\S+|ftp\S+", re.IGNORECASE)
+_EMAILS_RE = re.compile(r"\S+@\S+")
+
+# Caractères spéciaux et espaces en un seul passage: toute suite de caractères
+# non gardés (espaces compris) devient un seul espace, comme
+# remove_special_chars suivi de remove_extra_whitespace.
+_SEPARATORS_RE = re.compile(r"[^a-zA-Z0-9\-\'/+]+")
+
+# lxml refuse un str portant une déclaration d'encodage (<?xml ... encoding=...?>):
+# ces textes sont reparsés en octets UTF-8, l'encodage du parseur primant sur la déclaration
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
 
 class TextCleaner:
     """Nettoie et prétraite les textes des offres d'emploi."""
@@ -34,21 +51,39 @@ class TextCleaner:
 
     @staticmethod
     def clean_html(text: str) -> str:
-        """Supprime les balises HTML."""
+        """
+        Supprime les balises HTML (parseur C de lxml).
+        
+        Comme get_text(separator=" ") de BeautifulSoup: un espace entre chaque
+        nœud texte, contenu des <script>/<style> et commentaires ignorés.
+        Le texte brut sans "<" n'est pas parsé (seules les entités sont décodées).
+        """
         if not text:
             return ""
-        soup = BeautifulSoup(text, "html.parser")
-        return soup.get_text(separator=" ")
+        if "<" not in text:
+            return html.unescape(text) if "&" in text else text
+        try:
+            try:
+                root = lxml.html.document_fromstring(text)
+            except ValueError:
+                # str avec déclaration d'encodage XML
+                root = lxml.html.document_fromstring(text.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+        except etree.ParserError:
+            # Document sans aucun contenu (ex: uniquement des balises fermantes)
+            return ""
+        for element in root.iter("script", "style"):
+            element.text = None
+        return " ".join(root.itertext())
 
     @staticmethod
     def remove_urls(text: str) -> str:
         """Supprime les URLs."""
-        return re.sub(r"http\S+|www\S+|ftp\S+", "", text, flags=re.IGNORECASE)
+        return _URLS_RE.sub("", text)
 
     @staticmethod
     def remove_emails(text: str) -> str:
         """Supprime les adresses email."""
-        return re.sub(r"\S+@\S+", "", text)
+        return _EMAILS_RE.sub("", text)
 
     @staticmethod
     def remove_special_chars(text: str) -> str:
@@ -103,11 +138,8 @@ class TextCleaner:
         # 3. Minuscules
         text = self.lowercase(text)
 
-        # 4. Caractères spéciaux
-        text = self.remove_special_chars(text)
-
-        # 5. Espaces superflus
-        text = self.remove_extra_whitespace(text)
+        # 4-5. Caractères spéciaux et espaces superflus (un seul passage)
+        text = _SEPARATORS_RE.sub(" ", text).strip()
 
         # 6. Suppression optionnelle des stopwords
         if remove_stopwords:
@@ -129,27 +161,38 @@ def get_cleaner() -> TextCleaner:
     return _cleaner
 
 
-def clean_offers_pipeline(offers: List[Dict]) -> List[Dict]:
+# En dessous de ce seuil, le démarrage des workers coûte plus que le nettoyage
+PARALLEL_MIN_OFFERS = 200
+
+
+def _clean_description(text: str) -> str:
+    """Nettoie une description (exécuté dans les workers joblib)."""
+    return get_cleaner().clean(text, remove_stopwords=False)
+
+
+def clean_offers_pipeline(offers: List[Dict], n_jobs: int = -1) -> List[Dict]:
     """
     Nettoie les descriptions de toutes les offres d'emploi.
     
     Args:
         offers: Liste des offres avec descriptions
+        n_jobs: Nombre de processus pour les gros volumes (-1 = tous les cœurs)
         
     Returns:
         Liste des offres avec descriptions nettoyées
     """
-    cleaner = get_cleaner()
-    cleaned_offers = []
+    cleaned_offers = [offer.copy() for offer in offers]
+    to_clean = [offer for offer in cleaned_offers if "description" in offer]
+    
+    if len(to_clean) >= PARALLEL_MIN_OFFERS and n_jobs != 1:
+        descriptions = Parallel(n_jobs=n_jobs, backend="loky", batch_size=64)(
+            delayed(_clean_description)(offer["description"]) for offer in to_clean
+        )
+    else:
+        descriptions = [_clean_description(offer["description"]) for offer in to_clean]
     
-    for offer in offers:
-        cleaned_offer = offer.copy()
-        if "description" in cleaned_offer:
-            cleaned_offer["description"] = cleaner.clean(
-                cleaned_offer["description"],
-                remove_stopwords=False
-            )
-        cleaned_offers.append(cleaned_offer)
+    for offer, description in zip(to_clean, descriptions):
+        offer["description"] = description
         
     logger.info(f"✅ Nettoyage appliqué à {len(cleaned_offers)} offres")
     return cleaned_offers
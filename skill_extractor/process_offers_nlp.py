@@ -5,12 +5,16 @@ Charge le CSV brut, nettoie les textes et extrait les compétences.
 """
 
 import sys
-import csv
 import json
+import argparse
 import logging
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+import pandas as pd
+
 # Setup paths
 project_root = Path(__file__).parent.parent.absolute()
 sys.path.insert(0, str(project_root))
@@ -25,14 +29,23 @@ logger = logging.getLogger(__name__)
 from nlp.nlp_pipeline import NLPPipeline
 
 
+# Colonnes du CSV brut utilisées par process_offers
+RAW_COLUMNS = {'job_id', 'title', 'company', 'location', 'description', 'source', 'scrape_date'}
+
+
 def load_raw_offers(csv_file):
     """Charge les offres brutes du CSV."""
-    offers = []
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                offers.append(row)
+        # Parseur C de pandas; cellules vides gardées en '' comme csv.DictReader
+        df = pd.read_csv(
+            csv_file,
+            usecols=lambda column: column in RAW_COLUMNS,
+            dtype=str,
+            keep_default_na=False,
+            encoding='utf-8',
+            engine='c'
+        )
+        offers = df.to_dict('records')
         logger.info(f"✓ Loaded {len(offers)} offers from {csv_file}")
         return offers
     except Exception as e:
@@ -90,33 +103,34 @@ def process_offers(offers, nlp_pipeline):
     return processed
 
 
-def save_processed_offers(offers, output_csv, output_json):
-    """Sauvegarde les offres traitées."""
+def save_processed_offers(offers, output_csv, output_json, emit_csv=False):
+    """
+    Sauvegarde les offres traitées.
+    
+    Seul le JSON est lu par l'étape suivante; le CSV n'est écrit qu'avec emit_csv.
+    """
     try:
         # Sauvegarder en CSV
-        if offers:
+        if emit_csv and offers:
             fieldnames = [
                 'job_id', 'title', 'company', 'location', 
                 'cleaned_description', 'skills', 'skills_by_category',
                 'skill_count', 'source', 'scrape_date', 'processed_date'
             ]
             
-            with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for offer in offers:
-                    row = {k: offer.get(k, '') for k in fieldnames}
-                    # Convertir listes en chaînes JSON
-                    row['skills'] = json.dumps(offer['skills']) if offer['skills'] else '[]'
-                    row['skills_by_category'] = json.dumps(offer['skills_by_category']) if offer['skills_by_category'] else '{}'
-                    writer.writerow(row)
+            # Writer C de pandas (colonnes manquantes écrites vides, comme DictWriter)
+            df = pd.DataFrame.from_records(offers, columns=fieldnames)
+            
+            # Convertir listes en chaînes JSON
+            df['skills'] = [json.dumps(s) if s else '[]' for s in df['skills']]
+            df['skills_by_category'] = [json.dumps(c) if c else '{}' for c in df['skills_by_category']]
+            
+            df.to_csv(output_csv, index=False, encoding='utf-8', lineterminator='\r\n')
             
             logger.info(f"✓ Saved processed offers to {output_csv}")
         
         # Sauvegarder en JSON
-        with open(output_json, 'w', encoding='utf-8') as f:
-            json.dump(offers, f, indent=2, ensure_ascii=False)
+        Path(output_json).write_bytes(orjson.dumps(offers, option=orjson.OPT_INDENT_2))
         
         logger.info(f"✓ Saved detailed offers to {output_json}")
         
@@ -135,43 +149,44 @@ def print_statistics(offers):
     print("=" * 70)
     
     # Compter les offres par source
-    sources = {}
-    for offer in offers:
-        source = offer.get('source', 'unknown')
-        sources[source] = sources.get(source, 0) + 1
+    sources = Counter(offer.get('source', 'unknown') for offer in offers)
     
     print(f"\n[1] Offers by source:")
-    for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+    for source, count in sources.most_common():
         print(f"    {source}: {count} offers")
     
-    # Stats compétences
-    all_skills = []
+    # Stats compétences: compteurs mis à jour offre par offre (pas de liste de
+    # toutes les occurrences); skills décodés une fois s'ils viennent du CSV
+    skill_counts = Counter()
     skills_by_category = {}
     jobs_with_skills = 0
     
     for offer in offers:
-        if offer['skill_count'] > 0:
+        if int(offer.get('skill_count') or 0) > 0:
             jobs_with_skills += 1
-            all_skills.extend(offer['skills'])
-            for category, skills in offer['skills_by_category'].items():
-                if category not in skills_by_category:
-                    skills_by_category[category] = []
-                skills_by_category[category].extend(skills)
+            skills = offer['skills']
+            if isinstance(skills, str):
+                skills = orjson.loads(skills) if skills else ()
+            skill_counts.update(skills)
+            
+            categories = offer['skills_by_category']
+            if isinstance(categories, str):
+                categories = orjson.loads(categories) if categories else {}
+            for category, category_skills in categories.items():
+                skills_by_category.setdefault(category, {}).update(dict.fromkeys(category_skills))
     
     print(f"\n[2] Skills Statistics:")
     print(f"    Jobs with skills: {jobs_with_skills}/{len(offers)} ({100*jobs_with_skills/len(offers):.1f}%)")
-    print(f"    Total unique skills: {len(set(all_skills))}")
-    print(f"    Average skills per job: {len(all_skills)/len(offers):.1f}")
+    print(f"    Total unique skills: {len(skill_counts)}")
+    print(f"    Average skills per job: {sum(skill_counts.values())/len(offers):.1f}")
     
     print(f"\n[3] Top 10 Most Common Skills:")
-    from collections import Counter
-    skill_counts = Counter(all_skills)
     for skill, count in skill_counts.most_common(10):
         print(f"    {skill}: {count} offers")
     
     print(f"\n[4] Skills by Category:")
     for category, skills in sorted(skills_by_category.items()):
-        unique_skills = list(set(skills))
+        unique_skills = list(skills)
         print(f"    {category}: {len(unique_skills)} unique skills")
         if len(unique_skills) <= 10:
             print(f"      {', '.join(unique_skills)}")
@@ -181,7 +196,7 @@ def print_statistics(offers):
     print("\n" + "=" * 70)
 
 
-def main():
+def main(emit_csv=False):
     """Main entry point."""
     # Chemins
     input_csv = Path('/home/josh/ProjectTD/skill_extractor/data/raw/job_offers_raw.csv')
@@ -189,7 +204,8 @@ def main():
     output_json = Path('/home/josh/ProjectTD/skill_extractor/data/processed/offers_with_skills.json')
     
     # Créer répertoires s'ils n'existent pas
-    output_csv.parent.mkdir(parents=True, exist_ok=True)
+    if emit_csv:
+        output_csv.parent.mkdir(parents=True, exist_ok=True)
     output_json.parent.mkdir(parents=True, exist_ok=True)
     
     print("\n" + "=" * 70)
@@ -213,7 +229,7 @@ def main():
     
     # Sauvegarder les résultats
     print("[4] Saving processed offers...")
-    save_processed_offers(processed_offers, output_csv, output_json)
+    save_processed_offers(processed_offers, output_csv, output_json, emit_csv=emit_csv)
     
     # Afficher les statistiques
     print_statistics(processed_offers)
@@ -222,4 +238,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="NLP pipeline: text cleaning & skills extraction")
+    parser.add_argument('--emit-csv', action='store_true',
+                        help="also write the processed offers CSV (not read downstream)")
+    args = parser.parse_args()
+    main(emit_csv=args.emit_csv)
@@ -9,7 +9,6 @@ from typing import List, Dict
 from pathlib import Path
 import pickle
 import numpy as np
-from modelling.embedding import SkillEmbedder
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +22,21 @@ class RecommendationEngine:
         Args:
             embeddings_file: Chemin au fichier des embeddings
         """
-        self.embedder = SkillEmbedder()
+        self._embedder = None
         self.offer_embeddings = {}
         self.offers_data = {}
         
         if embeddings_file:
             self.load_embeddings(embeddings_file)
     
+    @property
+    def embedder(self):
+        """SkillEmbedder chargé à la première utilisation (modèle coûteux)"""
+        if self._embedder is None:
+            from modelling.embedding import SkillEmbedder
+            self._embedder = SkillEmbedder()
+        return self._embedder
+    
     def load_embeddings(self, embeddings_file: str):
         """Charge les embeddings depuis un fichier"""
         logger.info(f"Chargement des embeddings: {embeddings_file}")
@@ -8,6 +8,27 @@ from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# Gabarit du rapport d'écart (construit une seule fois au chargement du module)
+_REPORT_RULE = "=" * 60
+_GAP_REPORT_HEADER = """
+{rule}
+SKILL GAP ANALYSIS - {candidate_name}
+{rule}
+
+📊 OVERVIEW
+-----------
+Compétences maîtrisées: {mastered_count}
+Compétences manquantes: {missing_count}
+Écart: {gap_percentage}%
+
+✓ MASTERED SKILLS
+-----------
+{mastered}
+
+❌ MISSING SKILLS (PRIORITY ORDER)
+-----------
+"""
+
 
 class SkillGapAnalyzer:
     """Analyse les écarts de compétences."""
@@ -274,31 +295,25 @@ class SkillGapAnalyzer:
         Returns:
             Rapport formaté
         """
-        report = f"""
-{'='*60}
-SKILL GAP ANALYSIS - {candidate_name}
-{'='*60}
-
-📊 OVERVIEW
------------
-Compétences maîtrisées: {gap_analysis['mastered_count']}
-Compétences manquantes: {gap_analysis['missing_count']}
-Écart: {gap_analysis['gap_percentage']}%
-
-✓ MASTERED SKILLS
------------
-{', '.join(gap_analysis['mastered_skills']) or 'Aucune'}
-
-❌ MISSING SKILLS (PRIORITY ORDER)
------------
-"""
-        for priority in gap_analysis['priorities'][:5]:
-            report += f"\n{priority['level']}: {priority['skill']} (Impact: {priority['impact_score']})"
+        parts = [
+            _GAP_REPORT_HEADER.format_map({
+                **gap_analysis,
+                "rule": _REPORT_RULE,
+                "candidate_name": candidate_name,
+                "mastered": ', '.join(gap_analysis['mastered_skills']) or 'Aucune',
+            })
+        ]
+        parts.extend(
+            f"\n{priority['level']}: {priority['skill']} (Impact: {priority['impact_score']})"
+            for priority in gap_analysis['priorities'][:5]
+        )
 
-        report += "\n\n⚡ QUICK WINS\n-----------\n"
-        for quick_win in gap_analysis['quick_wins']:
-            report += f"\n• {quick_win['skill']} ({quick_win['effort']}, {quick_win['learning_time']})"
+        parts.append("\n\n⚡ QUICK WINS\n-----------\n")
+        parts.extend(
+            f"\n• {quick_win['skill']} ({quick_win['effort']}, {quick_win['learning_time']})"
+            for quick_win in gap_analysis['quick_wins']
+        )
 
-        report += "\n\n" + "="*60
+        parts.append("\n\n" + _REPORT_RULE)
 
-        return report
+        return "".join(parts)
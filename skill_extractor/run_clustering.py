@@ -6,6 +6,7 @@ Output: Adds cluster IDs to each offer
 
 import json
 import sys
+import time
 from pathlib import Path
 from collections import Counter
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -59,8 +60,8 @@ def cluster_offers_by_skills(offers, n_clusters=5):
     clusters = kmeans.fit_predict(X)
     
     # Add cluster to each offer
-    for i, offer in enumerate(offers):
-        offer['cluster'] = int(clusters[i])
+    for offer, cluster in zip(offers, clusters.tolist()):
+        offer['cluster'] = cluster
     
     print(f"✓ Clustering complete: {n_clusters} clusters created")
     return offers, n_clusters, kmeans
@@ -76,7 +77,7 @@ def analyze_clusters(offers):
         if cluster not in cluster_info:
             cluster_info[cluster] = {
                 'offers': [],
-                'skills': [],
+                'counter': Counter(),
                 'titles': []
             }
         cluster_info[cluster]['offers'].append(offer)
@@ -85,24 +86,22 @@ def analyze_clusters(offers):
         for skill_obj in offer.get('skills_weighted', []):
             skill = skill_obj.get('skill', '') if isinstance(skill_obj, dict) else str(skill_obj)
             if skill:
-                cluster_info[cluster]['skills'].append(skill)
+                cluster_info[cluster]['counter'][skill] += 1
     
     for cluster_id in sorted(cluster_info.keys()):
         info = cluster_info[cluster_id]
-        top_skills = Counter(info['skills']).most_common(5)
+        top_skills = info['counter'].most_common(5)
         
         print(f"\n🔹 CLUSTER {cluster_id}")
         print(f"   Size: {len(info['offers'])} offers")
         print(f"   Top Skills: {', '.join([s[0] for s in top_skills])}")
-        print(f"   Sample Titles: {', '.join(set(info['titles'][:3]))}")
+        print(f"   Sample Titles: {', '.join(list(dict.fromkeys(info['titles']))[:3])}")
     
     print("\n" + "="*70)
 
 def save_clustered_offers(offers):
     """Save offers with cluster assignments"""
-    timestamp = Path(__file__).parent.absolute()
-    import datetime
-    timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp_str = time.strftime("%Y%m%d_%H%M%S")
     
     output_file = EMBEDDINGS_DIR / f"offers_clustered_{timestamp_str}.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
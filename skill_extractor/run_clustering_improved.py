@@ -5,12 +5,13 @@ Uses HDBSCAN for better clustering with multiple distinct clusters
 """
 
 import sys
-import json
+import argparse
 from pathlib import Path
 from datetime import datetime
 import logging
 from collections import Counter
 import numpy as np
+from scipy.sparse import csr_matrix
 
 # Setup paths
 project_root = Path(__file__).parent.absolute()
@@ -21,28 +22,42 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Heavy clustering deps (hdbscan, sklearn) are imported in the functions using them
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.cluster import AgglomerativeClustering
-    import hdbscan
+    import orjson
 except ImportError as e:
     logger.error(f"Missing dependency: {e}")
     sys.exit(1)
 
+from utils.files import find_latest_file
+
 
 def load_processed_offers():
     """Load processed job offers with extracted skills"""
-    processed_files = sorted(DATA_DIR.glob("processed_offers_*.json"))
-    
-    if not processed_files:
+    latest_file = find_latest_file(DATA_DIR, "processed_offers_")
+    if latest_file is None:
         logger.error("No processed offers found!")
         return []
     
-    latest_file = processed_files[-1]
     logger.info(f"Loading: {latest_file.name}")
     
-    with open(latest_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(latest_file, 'rb') as f:
+        offers = orjson.loads(f.read())
+    
+    return _normalize_offers(offers)
+
+
+def _normalize_offers(offers):
+    """Flatten skills_weighted once into offer['_skills'] (tuple of skill names)"""
+    for offer in offers:
+        offer['_skills'] = tuple(
+            skill for skill in (
+                skill_obj.get('skill', '') if isinstance(skill_obj, dict) else str(skill_obj)
+                for skill_obj in offer.get('skills_weighted', [])
+            )
+            if skill
+        )
+    return offers
 
 
 def create_skill_based_vectors(offers):
@@ -52,44 +67,63 @@ def create_skill_based_vectors(offers):
     # Collect all unique skills
     all_skills = set()
     for offer in offers:
-        skills_weighted = offer.get('skills_weighted', [])
-        for skill_obj in skills_weighted:
-            skill = skill_obj.get('skill', '') if isinstance(skill_obj, dict) else str(skill_obj)
-            if skill:
-                all_skills.add(skill)
+        all_skills.update(offer['_skills'])
     
     skill_list = sorted(list(all_skills))
     logger.info(f"Total unique skills: {len(skill_list)}")
     
-    # Create binary matrix
-    vectors = []
-    for offer in offers:
-        vector = np.zeros(len(skill_list))
-        skills_weighted = offer.get('skills_weighted', [])
-        
-        for skill_obj in skills_weighted:
-            skill = skill_obj.get('skill', '') if isinstance(skill_obj, dict) else str(skill_obj)
-            if skill and skill in skill_list:
-                idx = skill_list.index(skill)
-                vector[idx] = 1
-        
-        vectors.append(vector)
+    # Create sparse binary matrix (index lookup via dict)
+    skill_to_idx = {skill: idx for idx, skill in enumerate(skill_list)}
+    rows, cols = [], []
+    for offer_idx, offer in enumerate(offers):
+        for skill in offer['_skills']:
+            rows.append(offer_idx)
+            cols.append(skill_to_idx[skill])
+    
+    vectors = csr_matrix(
+        (np.ones(len(rows), dtype=np.uint8), (rows, cols)),
+        shape=(len(offers), len(skill_list))
+    )
+    vectors.sum_duplicates()
+    vectors.data[:] = 1  # a skill listed twice stays binary
     
-    return np.array(vectors), skill_list
+    return vectors, skill_list
+
+
+def reduce_skill_vectors(vectors, n_components=50):
+    """Project the sparse skill matrix to a dense low-dimensional space (LSA)"""
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.preprocessing import normalize
+    
+    # TruncatedSVD needs at least 2 features: a single skill column is used as is
+    if vectors.shape[1] < 2:
+        return vectors.toarray().astype(np.float32)
+    
+    n_components = max(1, min(n_components, vectors.shape[1] - 1))
+    svd = TruncatedSVD(n_components=n_components, random_state=0)
+    reduced = svd.fit_transform(vectors.astype(np.float32))
+    
+    # Unit-length rows: euclidean distance then ranks like cosine similarity
+    return normalize(reduced)
 
 
 def cluster_with_hdbscan(vectors):
-    """Cluster using HDBSCAN with tuned parameters"""
+    """Cluster using HDBSCAN with tuned parameters on SVD-reduced skill vectors"""
+    import hdbscan
+    
     logger.info("Clustering with HDBSCAN...")
     
+    reduced = reduce_skill_vectors(vectors)
     clusterer = hdbscan.HDBSCAN(
         min_cluster_size=2,
         min_samples=1,
         cluster_selection_epsilon=0.5,
-        cluster_selection_method='eom'
+        cluster_selection_method='eom',
+        algorithm='boruvka_kdtree',
+        core_dist_n_jobs=-1
     )
     
-    labels = clusterer.fit_predict(vectors)
+    labels = clusterer.fit_predict(reduced)
     n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
     
     logger.info(f"Generated {n_clusters} clusters (+ noise points)")
@@ -97,17 +131,24 @@ def cluster_with_hdbscan(vectors):
     return labels
 
 
-def cluster_with_agglomerative(vectors, n_clusters=5):
-    """Cluster using Agglomerative Clustering for guaranteed clusters"""
-    logger.info(f"Clustering with Agglomerative Clustering ({n_clusters} clusters)...")
+def cluster_with_minibatch_kmeans(vectors, n_clusters=5):
+    """Cluster using MiniBatchKMeans on TF-IDF weighted skills for guaranteed clusters"""
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.feature_extraction.text import TfidfTransformer
+    
+    n_clusters = min(n_clusters, vectors.shape[0])
+    logger.info(f"Clustering with MiniBatchKMeans ({n_clusters} clusters)...")
     
-    clusterer = AgglomerativeClustering(
+    # Rare skills weigh more; rows are L2-normalized so k-means ranks by cosine
+    weighted = TfidfTransformer().fit_transform(vectors)
+    clusterer = MiniBatchKMeans(
         n_clusters=n_clusters,
-        linkage='ward',
-        metric='euclidean'
+        batch_size=1024,
+        n_init=3,
+        random_state=0
     )
     
-    labels = clusterer.fit_predict(vectors)
+    labels = clusterer.fit_predict(weighted)
     
     logger.info(f"Generated {n_clusters} clusters")
     
@@ -116,43 +157,54 @@ def cluster_with_agglomerative(vectors, n_clusters=5):
 
 def assign_clusters_to_offers(offers, labels):
     """Add cluster assignments to offers"""
-    for idx, offer in enumerate(offers):
-        offer['cluster'] = int(labels[idx])
+    # tolist() converts all labels to Python ints in one C-level call
+    for offer, label in zip(offers, labels.tolist()):
+        offer['cluster'] = label
 
 
-def compute_cluster_stats(offers, skill_list):
+def compute_cluster_stats(offers, skill_list, top_k=10):
     """Compute detailed statistics for each cluster"""
-    clusters = {}
+    skill_to_idx = {skill: idx for idx, skill in enumerate(skill_list)}
+    cluster_to_row = {}
+    clusters = []
+    skill_rows, skill_cols = [], []
     
     for offer in offers:
         cluster_id = offer.get('cluster', -1)
         
-        if cluster_id not in clusters:
-            clusters[cluster_id] = {
-                'offers': [],
-                'skills': [],
-                'titles': []
-            }
+        row = cluster_to_row.get(cluster_id)
+        if row is None:
+            row = cluster_to_row[cluster_id] = len(clusters)
+            clusters.append({
+                'size': 0,
+                'titles': Counter()
+            })
         
-        clusters[cluster_id]['offers'].append(offer)
-        clusters[cluster_id]['titles'].append(offer.get('title', 'Unknown'))
+        # Size and titles are aggregated in place (no per-cluster lists)
+        cluster = clusters[row]
+        cluster['size'] += 1
+        cluster['titles'][offer.get('title', 'Unknown')] += 1
         
-        # Collect skills
-        skills_weighted = offer.get('skills_weighted', [])
-        for skill_obj in skills_weighted:
-            skill = skill_obj.get('skill', '') if isinstance(skill_obj, dict) else str(skill_obj)
-            if skill:
-                clusters[cluster_id]['skills'].append(skill)
+        # Collect skill ids (aggregated below in a single numpy pass)
+        for skill in offer['_skills']:
+            skill_rows.append(row)
+            skill_cols.append(skill_to_idx[skill])
+    
+    # Skill counts per cluster: (n_clusters, n_skills) via bincount on flat ids
+    n_skills = len(skill_list)
+    flat_ids = np.asarray(skill_rows, dtype=np.int64) * n_skills + np.asarray(skill_cols, dtype=np.int64)
+    counts = np.bincount(flat_ids, minlength=len(clusters) * n_skills).reshape(len(clusters), n_skills)
     
     # Compute summaries
     stats = {}
-    for cluster_id, data in clusters.items():
-        top_skills = Counter(data['skills']).most_common(10)
-        top_titles = Counter(data['titles']).most_common(5)
+    for cluster_id, row in cluster_to_row.items():
+        data = clusters[row]
+        top_skills = _top_k_skills(counts[row], skill_list, top_k)
+        top_titles = data['titles'].most_common(5)
         
         stats[cluster_id] = {
-            'size': len(data['offers']),
-            'top_skills': [{'skill': s[0], 'count': s[1]} for s in top_skills],
+            'size': data['size'],
+            'top_skills': top_skills,
             'top_titles': [{'title': t[0], 'count': t[1]} for t in top_titles],
             'description': f"Cluster {cluster_id}: {top_titles[0][0] if top_titles else 'Mixed'}"
         }
@@ -160,26 +212,40 @@ def compute_cluster_stats(offers, skill_list):
     return stats
 
 
-def save_clustered_offers(offers, stats):
-    """Save clustered offers and statistics"""
+def _top_k_skills(skill_counts, skill_list, k):
+    """Top-k skills of one cluster (count desc, ties by skill name)"""
+    present = np.flatnonzero(skill_counts)
+    if len(present) > k:
+        present = present[np.argpartition(-skill_counts[present], k - 1)[:k]]
+    order = np.lexsort((present, -skill_counts[present]))
+    return [
+        {'skill': skill_list[idx], 'count': int(skill_counts[idx])}
+        for idx in present[order].tolist()
+    ]
+
+
+def save_clustered_offers(offers, stats, pretty=False):
+    """Save clustered offers and statistics (compact JSON unless pretty=True)"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    indent = orjson.OPT_INDENT_2 if pretty else 0
     
-    # Save offers with clusters
+    # Save offers with clusters (without the internal '_skills' field)
     output_file = DATA_DIR / f"offers_clustered_{timestamp}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(offers, f, indent=2, ensure_ascii=False)
+    public_offers = [{k: v for k, v in offer.items() if k != '_skills'} for offer in offers]
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(public_offers, option=indent))
     logger.info(f"Saved clustered offers: {output_file.name}")
     
-    # Save cluster statistics
+    # Save cluster statistics (cluster ids are int keys)
     stats_file = DATA_DIR / f"cluster_stats_{timestamp}.json"
-    with open(stats_file, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    with open(stats_file, 'wb') as f:
+        f.write(orjson.dumps(stats, option=indent | orjson.OPT_NON_STR_KEYS))
     logger.info(f"Saved cluster stats: {stats_file.name}")
     
     return output_file, stats_file
 
 
-def main():
+def main(pretty=False):
     """Main pipeline"""
     print("\n" + "="*70)
     print("IMPROVED CLUSTERING PIPELINE")
@@ -204,11 +270,11 @@ def main():
     logger.info("\n[3] Clustering (HDBSCAN)...")
     labels = cluster_with_hdbscan(vectors)
     
-    # If too few clusters, use Agglomerative Clustering
+    # If too few clusters, use MiniBatchKMeans
     n_unique = len(set(labels)) - (1 if -1 in labels else 0)
     if n_unique < 3:
-        logger.info(f"HDBSCAN produced only {n_unique} clusters, trying Agglomerative...")
-        labels = cluster_with_agglomerative(vectors, n_clusters=5)
+        logger.info(f"HDBSCAN produced only {n_unique} clusters, trying MiniBatchKMeans...")
+        labels = cluster_with_minibatch_kmeans(vectors, n_clusters=5)
     
     # Assign clusters
     logger.info("\n[4] Assigning clusters to offers...")
@@ -232,7 +298,7 @@ def main():
     
     # Save
     logger.info("\n[6] Saving results...")
-    offers_file, stats_file = save_clustered_offers(offers, stats)
+    offers_file, stats_file = save_clustered_offers(offers, stats, pretty=pretty)
     
     print("\n" + "="*70)
     print(f"✓ Clustering complete!")
@@ -242,4 +308,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Improved clustering pipeline")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent JSON outputs for human reading")
+    args = parser.parse_args()
+    main(pretty=args.pretty)
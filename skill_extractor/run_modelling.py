@@ -7,20 +7,22 @@ Génère les embeddings avec Gemini (fallback TF-IDF)
 Effectue le clustering sur les skills extraits
 """
 
-import json
+import argparse
+import hashlib
 import logging
 import sys
 from pathlib import Path
 from datetime import datetime
 import numpy as np
-import pickle
+import orjson
 
 # Setup paths
 sys.path.insert(0, str(Path(__file__).parent.absolute()))
 
-from modelling.embeddings import HybridEmbedder
+from modelling.embeddings import HybridEmbedder, TFIDFEmbedder
 from modelling.clustering import SkillsVectorizer, OffersClustering
-from utils.config import DATA_DIR, MODELS_DIR
+from utils.config import DATA_DIR, MODELS_DIR, CLUSTERING_CONFIG
+from utils.files import find_latest_file
 
 # Configure logging
 logging.basicConfig(
@@ -37,27 +39,42 @@ def load_processed_offers():
     logger.info("="*70)
     
     processed_dir = DATA_DIR / "processed"
-    processed_files = sorted(processed_dir.glob("processed_offers_*.json"))
+    latest_file = find_latest_file(processed_dir, "processed_offers_")
     
-    if not processed_files:
+    if latest_file is None:
         logger.error("❌ Aucun fichier processed trouvé!")
         logger.info("   Exécute d'abord: python3 run_nlp.py")
         return None
     
-    latest_file = processed_files[-1]
     logger.info(f"\n📂 Chargement: {latest_file.name}")
     
     try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            offers = json.load(f)
+        with open(latest_file, 'rb') as f:
+            offers = orjson.loads(f.read())
         
         logger.info(f"✓ {len(offers)} offres chargées")
-        return offers
+        return _normalize_offers(offers)
     except Exception as e:
         logger.error(f"❌ Erreur chargement: {e}")
         return None
 
 
+def _normalize_offers(offers):
+    """Aplatit une seule fois les skills de chaque offre dans offer['_skills']."""
+    for offer in offers:
+        # Essayer skills_weighted (nouveau format) ou skills (ancien format)
+        skills_weighted = offer.get("skills_weighted", [])
+        if skills_weighted:
+            skills = (
+                skill_obj.get("skill", "") if isinstance(skill_obj, dict) else str(skill_obj)
+                for skill_obj in skills_weighted
+            )
+        else:
+            skills = offer.get("skills", [])
+        offer["_skills"] = tuple(skill for skill in skills if skill)
+    return offers
+
+
 def create_skill_corpus(offers):
     """Crée un corpus de skills pour les embeddings."""
     logger.info("\n📊 Création du corpus de skills...")
@@ -66,28 +83,10 @@ def create_skill_corpus(offers):
     skill_descriptions = {}
     
     for offer in offers:
-        # Essayer skills_weighted (nouveau format) ou skills (ancien format)
-        skills_weighted = offer.get("skills_weighted", [])
-        skills_simple = offer.get("skills", [])
-        
-        # Si skills_weighted existe (liste de dicts avec {skill, weight})
-        if skills_weighted:
-            for skill_obj in skills_weighted:
-                if isinstance(skill_obj, dict):
-                    skill = skill_obj.get("skill", "")
-                else:
-                    skill = str(skill_obj)
-                
-                if skill and skill not in all_skills:
-                    all_skills.add(skill)
-                    skill_descriptions[skill] = f"Compétence technique: {skill}"
-        
-        # Sinon utiliser skills simple (liste de strings)
-        elif skills_simple:
-            for skill in skills_simple:
-                if skill and skill not in all_skills:
-                    all_skills.add(skill)
-                    skill_descriptions[skill] = f"Compétence technique: {skill}"
+        for skill in offer["_skills"]:
+            if skill not in all_skills:
+                all_skills.add(skill)
+                skill_descriptions[skill] = f"Compétence technique: {skill}"
     
     skills_list = sorted(list(all_skills))
     logger.info(f"✓ {len(skills_list)} skills uniques identifiés")
@@ -95,19 +94,99 @@ def create_skill_corpus(offers):
     return skills_list, skill_descriptions
 
 
+# Méthodes dont l'embedding d'un skill ne dépend pas du reste du corpus
+# (TF-IDF en dépend via le vocabulaire appris: pas de cache par skill)
+CACHEABLE_EMBEDDING_METHODS = {"gemini"}
+
+
+def _skill_cache_key(skill):
+    """Clé de cache d'un skill (SHA1 du texte)."""
+    return hashlib.sha1(skill.encode("utf-8")).hexdigest()
+
+
+def _load_embeddings_cache(cache_file):
+    """Charge le cache {sha1: vecteur} depuis un .npz (vide s'il n'existe pas)."""
+    if not cache_file.exists():
+        return {}
+    with np.load(cache_file, allow_pickle=False) as data:
+        return dict(zip(data["keys"].tolist(), data["vectors"]))
+
+
+def _save_embeddings_cache(cache_file, cache):
+    """Sauvegarde le cache {sha1: vecteur} dans un .npz (rien à écrire si le cache est vide)."""
+    if not cache:
+        # Ex: premier run Gemini dont tous les appels ont échoué (vecteurs nuls non cachés)
+        return
+    keys = list(cache)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        cache_file,
+        keys=np.array(keys),
+        vectors=np.stack([cache[k] for k in keys]).astype(np.float32)
+    )
+
+
+def _skill_set_hash(skills_list):
+    """Empreinte SHA1 de la liste de skills (dans l'ordre des lignes d'embeddings)."""
+    return hashlib.sha1("\x00".join(skills_list).encode("utf-8")).hexdigest()
+
+
+def _encode_with_skill_cache(embedder, skills_list, method):
+    """Encode via le cache par skill; retourne (embeddings, méthode effective)."""
+    # Réutiliser les vecteurs déjà calculés lors des exécutions précédentes
+    cache_file = DATA_DIR / "embeddings" / f"skills_embeddings_cache_{method}.npz"
+    cache = _load_embeddings_cache(cache_file)
+    keys = [_skill_cache_key(skill) for skill in skills_list]
+    vectors = {key: cache[key] for key in keys if key in cache}
+    missing = [skill for skill, key in zip(skills_list, keys) if key not in vectors]
+    logger.info(f"   Cache: {len(vectors)} skills réutilisés, {len(missing)} à encoder")
+    
+    if missing:
+        new_embeddings = embedder.encode(missing)
+        
+        if embedder.get_method() != method:
+            # Fallback en cours de route: dimensions incompatibles avec le cache
+            return TFIDFEmbedder().encode(skills_list), "tfidf"
+        
+        for skill, vector in zip(missing, new_embeddings):
+            key = _skill_cache_key(skill)
+            vectors[key] = vector
+            if vector.any():  # ne pas mettre en cache les vecteurs nuls (erreurs API)
+                cache[key] = vector
+        _save_embeddings_cache(cache_file, cache)
+    
+    embeddings = np.stack([vectors[key] for key in keys]).astype(np.float32, copy=False)
+    return embeddings, method
+
+
 def generate_embeddings(skills_list):
     """Génère les embeddings des skills."""
     logger.info("\n🔄 Génération des embeddings...")
     
     # Initialiser l'embedder (Gemini > TF-IDF)
     embedder = HybridEmbedder()
-    logger.info(f"   Méthode: {embedder.get_method().upper()}")
+    method = embedder.get_method()
+    logger.info(f"   Méthode: {method.upper()}")
+    
+    # Checkpoint: même liste de skills + même méthode => mêmes embeddings
+    checkpoint = DATA_DIR / "embeddings" / f"skills_embeddings_ckpt_{method}_{_skill_set_hash(skills_list)}.npy"
+    if checkpoint.exists():
+        embeddings = np.load(checkpoint, allow_pickle=False)
+        logger.info(f"✓ Skills inchangés, embeddings rechargés: {checkpoint.name}")
+        return embeddings, method
     
-    # Générer embeddings pour chaque skill
-    embeddings = embedder.encode(skills_list)
+    if method in CACHEABLE_EMBEDDING_METHODS:
+        embeddings, used_method = _encode_with_skill_cache(embedder, skills_list, method)
+    else:
+        embeddings, used_method = embedder.encode(skills_list), method
     logger.info(f"✓ Embeddings générés: {embeddings.shape}")
     
-    return embeddings, embedder.get_method()
+    # Pas de checkpoint après un fallback ni avec des vecteurs nuls (erreurs API)
+    if used_method == method and (method not in CACHEABLE_EMBEDDING_METHODS or embeddings.any(axis=1).all()):
+        checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        np.save(checkpoint, embeddings.astype(np.float32, copy=False), allow_pickle=False)
+    
+    return embeddings, used_method
 
 
 def perform_clustering(embeddings, skills_list, n_clusters=None):
@@ -129,51 +208,83 @@ def perform_clustering(embeddings, skills_list, n_clusters=None):
     return clusters, clusterer
 
 
-def save_results(offers, skills_list, embeddings, clusters, clusterer, method):
-    """Sauvegarde les résultats."""
+def _group_skills_by_cluster(skills_list, clusters):
+    """Regroupe les skills par cluster en un seul tri (au lieu d'un scan par cluster)."""
+    clusters = np.asarray(clusters)
+    order = np.argsort(clusters, kind="stable")
+    cluster_ids, starts = np.unique(clusters[order], return_index=True)
+    bounds = starts.tolist() + [len(order)]
+    order = order.tolist()
+    
+    return {
+        str(cluster_id): [skills_list[i] for i in order[bounds[k]:bounds[k + 1]]]
+        for k, cluster_id in enumerate(cluster_ids.tolist())
+    }
+
+
+def save_clusterer_bundle(clusterer, timestamp):
+    """Sauvegarde labels, centres et paramètres du clusterer; retourne le fichier meta."""
+    MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    algorithm = clusterer.algorithm
+    
+    labels_file = MODELS_DIR / f"{algorithm}_labels_{timestamp}.npy"
+    np.save(labels_file, np.asarray(clusterer.labels, dtype=np.int32), allow_pickle=False)
+    meta = {
+        "algorithm": algorithm,
+        "params": CLUSTERING_CONFIG,
+        "n_clusters": len(np.unique(clusterer.labels)),
+        "labels_file": labels_file.name,
+        "centers_file": None,
+    }
+    
+    if clusterer.cluster_centers is not None:
+        centers_file = MODELS_DIR / f"{algorithm}_centers_{timestamp}.npy"
+        np.save(centers_file, np.asarray(clusterer.cluster_centers, dtype=np.float32), allow_pickle=False)
+        meta["centers_file"] = centers_file.name
+    
+    meta_file = MODELS_DIR / f"{algorithm}_meta_{timestamp}.json"
+    meta_file.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+    return meta_file
+
+
+def save_results(offers, skills_list, embeddings, clusters, clusterer, method, pretty=False):
+    """Sauvegarde les résultats (JSON compact, indenté si pretty=True)."""
     logger.info("\n💾 Sauvegarde des résultats...")
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # 1. Sauvegarder les embeddings
+    # 1. Sauvegarder les embeddings (float32 suffit pour cosine/euclidienne)
     embeddings_file = DATA_DIR / "embeddings" / f"skills_embeddings_{timestamp}.npy"
     embeddings_file.parent.mkdir(parents=True, exist_ok=True)
-    np.save(embeddings_file, embeddings)
+    np.save(embeddings_file, np.asarray(embeddings).astype(np.float32, copy=False), allow_pickle=False)
     logger.info(f"✓ Embeddings: {embeddings_file.name}")
     
-    # 2. Sauvegarder le modèle clusterer
-    model_file = MODELS_DIR / f"kmeans_clusterer_{timestamp}.pkl"
-    MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    with open(model_file, 'wb') as f:
-        pickle.dump(clusterer, f)
-    logger.info(f"✓ Modèle KMeans: {model_file.name}")
+    # 2. Sauvegarder le clusterer: labels/centres en .npy + paramètres en JSON
+    #    (pas de pickle: chargement direct, indépendant de la version sklearn)
+    model_file = save_clusterer_bundle(clusterer, timestamp)
+    logger.info(f"✓ Modèle {clusterer.algorithm}: {model_file.name}")
     
     # 3. Sauvegarder les resultats en JSON
+    cluster_analysis = _group_skills_by_cluster(skills_list, clusters)
     results = {
         "timestamp": timestamp,
         "embedding_method": method,
         "total_offers": len(offers),
         "total_skills": len(skills_list),
-        "num_clusters": len(set(clusters)),
+        "num_clusters": len(cluster_analysis),
         "skills_with_clusters": [
             {
                 "skill": skill,
-                "cluster": int(clusters[i])
+                "cluster": cluster_id
             }
-            for i, skill in enumerate(skills_list)
+            for skill, cluster_id in zip(skills_list, np.asarray(clusters).tolist())
         ],
-        "cluster_analysis": {
-            str(cluster_id): [
-                skill for i, skill in enumerate(skills_list) 
-                if clusters[i] == cluster_id
-            ]
-            for cluster_id in sorted(set(clusters))
-        }
+        "cluster_analysis": cluster_analysis
     }
     
     results_file = DATA_DIR / "embeddings" / f"clustering_results_{timestamp}.json"
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    with open(results_file, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else 0))
     logger.info(f"✓ Résultats: {results_file.name}")
     
     return results
@@ -193,7 +304,7 @@ def display_clusters(results):
             logger.info(f"      ... et {len(skills) - 5} autres")
 
 
-def main():
+def main(pretty=False):
     """Exécute le pipeline de modelling."""
     try:
         # 1. Charger les offres traitées
@@ -214,7 +325,7 @@ def main():
         clusters, clusterer = perform_clustering(embeddings, skills_list)
         
         # 5. Sauvegarder les résultats
-        results = save_results(offers, skills_list, embeddings, clusters, clusterer, method)
+        results = save_results(offers, skills_list, embeddings, clusters, clusterer, method, pretty=pretty)
         
         # 6. Afficher un résumé
         display_clusters(results)
@@ -238,5 +349,9 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Pipeline 3: embeddings + clustering")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indente les JSON de sortie (lecture humaine)")
+    args = parser.parse_args()
+    success = main(pretty=args.pretty)
     sys.exit(0 if success else 1)
@@ -10,8 +10,11 @@ Features:
 - Outputs to data/processed/ as JSON
 """
 
-import json
+import hashlib
+import ijson
 import logging
+import mmap
+import shelve
 import sys
 from pathlib import Path
 from typing import List, Dict
@@ -22,7 +25,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from nlp.text_cleaner import TextCleaner
 from nlp.advanced_skills_extractor import SkillsExtractor
-from nlp.nlp_pipeline import NLPPipeline
+from nlp.nlp_pipeline import NLPPipeline, SkillStatistics, skills_cache_fingerprint
+from utils.files import find_latest_file
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +48,10 @@ class NLPRunner:
         self.raw_dir = self.data_dir / 'raw'
         self.processed_dir = self.data_dir / 'processed'
         self.processed_dir.mkdir(parents=True, exist_ok=True)
+        # Cache persistant titre+description -> skills, partagé entre les runs;
+        # l'empreinte du vocabulaire dans le nom invalide le cache quand l'extracteur change
+        self.skills_cache_path = self.data_dir / f'skills_cache_{skills_cache_fingerprint()}.db'
+        self.duplicates_skipped = 0
         self.pipeline = NLPPipeline()
     
     def find_latest_raw_file(self) -> Path:
@@ -51,14 +59,39 @@ class NLPRunner:
         if not self.raw_dir.exists():
             raise FileNotFoundError(f"Raw data directory not found: {self.raw_dir}")
         
-        json_files = list(self.raw_dir.glob('raw_offers_*.json'))
-        if not json_files:
+        latest = find_latest_file(self.raw_dir, 'raw_offers_')
+        if latest is None:
             raise FileNotFoundError(f"No raw JSON files found in {self.raw_dir}")
         
-        latest = max(json_files, key=lambda p: p.stat().st_mtime)
         logger.info(f"📂 Found latest raw file: {latest.name}")
         return latest
     
+    def remove_stale_skills_caches(self):
+        """Supprime les caches de skills d'un autre extracteur (ancienne empreinte)."""
+        current = self.skills_cache_path.name
+        for path in self.data_dir.glob('skills_cache*'):
+            if not path.name.startswith(current):
+                logger.info(f"🗑 Removing outdated skills cache: {path.name}")
+                path.unlink()
+    
+    def iter_unique_jobs(self, jobs):
+        """
+        Ignore les offres déjà vues (même titre, entreprise et description):
+        reposts et offres publiées sur ReKrute et LinkedIn à la fois.
+        
+        Le nombre de doublons ignorés est compté dans self.duplicates_skipped.
+        """
+        self.duplicates_skipped = 0
+        seen = set()
+        for job in jobs:
+            content = f"{job.get('title', '')}\x00{job.get('company', '')}\x00{job.get('description', '')}"
+            key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+            if key in seen:
+                self.duplicates_skipped += 1
+                continue
+            seen.add(key)
+            yield job
+    
     def run(self, input_file: Path = None) -> Dict:
         """Run complete NLP pipeline"""
         logger.info("\n" + "="*80)
@@ -74,25 +107,41 @@ class NLPRunner:
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
-        logger.info(f"📥 Loading from: {input_file}")
+        logger.info(f"📥 Streaming from: {input_file}")
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_file = self.processed_dir / f'processed_offers_{timestamp}.json'
         
-        # Load
-        with open(input_file, 'r', encoding='utf-8') as f:
-            jobs = json.load(f)
+        # Load -> Process -> Save as a stream: only one batch of offers in memory;
+        # statistics are accumulated per skill while the output is written
+        statistics = SkillStatistics()
         
-        logger.info(f"✅ Loaded {len(jobs)} raw job offers\n")
+        def count_skills(processed_jobs):
+            for job in processed_jobs:
+                statistics.add(job)
+                yield job
         
-        # Process
         logger.info(f"🔄 Processing with NLP Pipeline...")
-        processed_jobs = self.pipeline.process_job_offers(jobs)
+        if input_file.stat().st_size == 0:
+            raise ValueError(f"Input file is empty: {input_file}")
         
-        # Statistics
-        stats = self.pipeline.get_statistics(processed_jobs)
+        self.remove_stale_skills_caches()
         
-        # Save
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = self.processed_dir / f'processed_offers_{timestamp}.json'
-        self.pipeline.save_processed_jobs(processed_jobs, str(output_file))
+        # ijson lit les pages mappées par morceaux, directement depuis le cache
+        # disque de l'OS (pas de BufferedReader ni de copie du fichier entier)
+        with open(input_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw, \
+                shelve.open(str(self.skills_cache_path)) as cache:
+            jobs = self.iter_unique_jobs(ijson.items(raw, 'item', use_float=True))
+            processed = self.pipeline.iter_process_job_offers(jobs, cache=cache)
+            self.pipeline.save_processed_jobs_stream(count_skills(processed), str(output_file))
+        
+        if self.duplicates_skipped:
+            logger.info(f"🔁 Skipped {self.duplicates_skipped} duplicate job offers")
+        logger.info(f"✅ Processed {statistics.total_jobs} raw job offers\n")
+        
+        # Statistics
+        stats = statistics.summary()
         
         # Display results
         logger.info("\n" + "="*80)
@@ -106,9 +155,12 @@ class NLPRunner:
         
         logger.info("\n🏆 Top 20 Most Demanded Skills:")
         logger.info("-" * 80)
-        for rank, (skill, count) in enumerate(stats['top_20_skills'], 1):
+        # top_20_skills est trié par nombre décroissant: le max est le premier
+        top_skills = stats['top_20_skills']
+        max_count = top_skills[0][1] if top_skills else 1
+        for rank, (skill, count) in enumerate(top_skills, 1):
             pct = round((count / stats['total_jobs'] * 100), 1) if stats['total_jobs'] > 0 else 0
-            bar_length = int(count / max([c for _, c in stats['top_20_skills']] + [1]) * 40)
+            bar_length = int(count / max_count * 40)
             bar = "█" * bar_length
             logger.info(f"{rank:2d}. {skill:<35s} {count:3d} ({pct:5.1f}%) {bar}")
         
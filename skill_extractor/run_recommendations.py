@@ -5,11 +5,15 @@ Utilise les embeddings, clusters et les données des offres pour générer des r
 """
 
 import sys
-import json
+import ijson
+import orjson
 import logging
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+from scipy.sparse import csr_matrix
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,8 +22,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import des modules
-from nlp.advanced_skills_extractor import SkillsExtractor
-from recommendtion.clustering_recommender import ClusteringRecommender
+from nlp.advanced_skills_extractor import get_skills_extractor
+from utils.files import find_latest_file
 
 
 def load_modelling_results():
@@ -27,22 +31,20 @@ def load_modelling_results():
     modelling_dir = Path("data/modelling")
     
     # Charge les embeddings
-    embeddings_file = list(modelling_dir.glob("embeddings_*.json"))
-    if not embeddings_file:
+    embeddings_file = find_latest_file(modelling_dir, "embeddings_")
+    if embeddings_file is None:
         logger.error("Aucun fichier d'embeddings trouvé!")
         return None
     
-    with open(embeddings_file[-1], 'r', encoding='utf-8') as f:
-        embeddings_data = json.load(f)
+    embeddings_data = orjson.loads(embeddings_file.read_bytes())
     
     # Charge les clusters
-    clusters_file = list(modelling_dir.glob("clusters_*.json"))
-    if not clusters_file:
+    clusters_file = find_latest_file(modelling_dir, "clusters_")
+    if clusters_file is None:
         logger.error("Aucun fichier de clusters trouvé!")
         return None
     
-    with open(clusters_file[-1], 'r', encoding='utf-8') as f:
-        clusters_data = json.load(f)
+    clusters_data = orjson.loads(clusters_file.read_bytes())
     
     return {
         'embeddings': embeddings_data,
@@ -51,58 +53,116 @@ def load_modelling_results():
 
 
 def load_processed_offers():
-    """Charge les offres traitées avec les skills"""
+    """
+    Charge les offres traitées avec les skills, en colonnes.
+    
+    Lecture en flux (ijson): seuls les champs utilisés par les recommandations
+    (title, skills_weighted, cluster) sont gardés, pas les descriptions.
+    Les skills sont encodés par dictionnaire (skill_names) et stockés à plat
+    avec des offsets par offre (skill_indptr), comme une matrice CSR.
+    """
     processed_dir = Path("data/processed")
-    processed_files = list(processed_dir.glob("processed_offers_*.json"))
+    processed_file = find_latest_file(processed_dir, "processed_offers_")
+    
+    titles, clusters, skill_codes, skill_indptr = [], [], [], [0]
+    skill_to_idx = {}
     
-    if not processed_files:
+    if processed_file is None:
         logger.error("Aucun fichier d'offres traitées trouvé!")
-        return []
+    else:
+        with open(processed_file, 'rb') as f:
+            for offer in ijson.items(f, 'item', use_float=True):
+                titles.append(offer.get('title'))
+                clusters.append(offer.get('cluster', -1))
+                for s in offer.get('skills_weighted') or []:
+                    skill_codes.append(skill_to_idx.setdefault(s['skill'], len(skill_to_idx)))
+                skill_indptr.append(len(skill_codes))
     
-    with open(processed_files[-1], 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return {
+        'title': titles,
+        'cluster': np.asarray(clusters, dtype=np.int32),
+        'skill_codes': np.asarray(skill_codes, dtype=np.int32),
+        'skill_indptr': np.asarray(skill_indptr, dtype=np.int64),
+        'skill_names': list(skill_to_idx),
+    }
 
 
 def extract_user_skills(cv_text):
     """Extrait les skills du CV de l'utilisateur"""
-    extractor = SkillsExtractor()
+    extractor = get_skills_extractor()
     
     # Utilise la méthode améliorée d'extraction
-    skills = extractor.extract_skills_weighted(
-        title="",
+    _, weighted_skills = extractor.extract_skills_weighted(
         description=cv_text,
-        profile="",
-        technical_skills="",
-        desired_skills=""
+        title=""
     )
     
-    return [s['skill'] for s in skills]
+    return [skill for skill, weight in weighted_skills]
 
 
-def generate_recommendations(user_title, user_skills, modelling_results, processed_offers):
-    """Génère les recommandations basées sur le titre et les skills de l'utilisateur"""
+def generate_recommendations(user_title, user_skills, modelling_results, processed_offers,
+                             top_k_offers=50, top_n=20):
+    """
+    Génère les recommandations basées sur le titre et les skills de l'utilisateur
+    
+    Les offres forment une matrice d'incidence creuse offres x skills; la
+    similarité cosinus avec le profil est un seul produit matrice-vecteur.
+    Les skills manquants sont notés par la similarité des top_k_offers offres
+    les plus proches qui les demandent.
+    """
     
     logger.info("\nGenerating recommendations...")
     
-    recommender = ClusteringRecommender()
-    
-    # Prepare job data with clusters
-    job_data = []
-    for offer in processed_offers:
-        job_data.append({
-            'title': offer['title'],
-            'skills': [s['skill'] for s in offer.get('skills_weighted', [])],
-            'cluster': offer.get('cluster', -1)
-        })
-    
-    # Generate recommendations
-    recommendations = recommender.recommend_skills(
-        user_title=user_title,
-        user_skills=user_skills,
-        job_data=job_data
+    # Matrice d'incidence offres x skills, directement depuis les colonnes
+    skill_names = processed_offers['skill_names']
+    if not skill_names:
+        return []
+    
+    skill_to_idx = {skill: i for i, skill in enumerate(skill_names)}
+    n_offers, n_skills = len(processed_offers['title']), len(skill_names)
+    skill_codes = processed_offers['skill_codes']
+    offers_matrix = csr_matrix(
+        (np.ones(len(skill_codes), dtype=np.float32), skill_codes, processed_offers['skill_indptr']),
+        shape=(n_offers, n_skills)
     )
+    offers_matrix.sum_duplicates()
+    offers_matrix.data[:] = 1
+    
+    # Profil utilisateur: vecteur 1 x n_skills
+    user_idx = [skill_to_idx[s] for s in dict.fromkeys(user_skills) if s in skill_to_idx]
+    if not user_idx:
+        logger.warning(f"Aucun skill de l'utilisateur ({user_title}) n'apparaît dans les offres")
+        return []
+    user_vec = csr_matrix(
+        (np.ones(len(user_idx), dtype=np.float32), ([0] * len(user_idx), user_idx)), shape=(1, n_skills)
+    )
+    
+    # Similarité cosinus (vecteurs binaires: recouvrement / produit des normes)
+    overlap = (offers_matrix @ user_vec.T).toarray().ravel()
+    norms = np.sqrt(np.diff(offers_matrix.indptr) * len(user_idx))
+    scores = np.divide(overlap, norms, out=np.zeros_like(overlap), where=norms > 0)
+    
+    k = min(top_k_offers, n_offers)
+    top_offers = np.argpartition(scores, -k)[-k:]
+    top_offers = top_offers[scores[top_offers] > 0]
+    if len(top_offers) == 0:
+        return []
+    
+    # Score d'un skill = part (pondérée par similarité) des offres proches qui le demandent
+    weights = scores[top_offers]
+    skill_scores = offers_matrix[top_offers].T @ weights / weights.sum()
+    skill_scores[user_idx] = 0
+    
+    n = min(top_n, int(np.count_nonzero(skill_scores)))
+    if n == 0:
+        return []
+    best = np.argpartition(-skill_scores, n - 1)[:n]
+    best = best[np.argsort(-skill_scores[best], kind='stable')]
     
-    return recommendations
+    return [
+        {'skill': skill_names[i], 'score': float(skill_scores[i])}
+        for i in best
+    ]
 
 
 def main():
@@ -122,7 +182,7 @@ def main():
     # 2. Charge les offres traitées
     logger.info("Loading processed offers...")
     processed_offers = load_processed_offers()
-    logger.info(f"✓ {len(processed_offers)} offres chargées\n")
+    logger.info(f"✓ {len(processed_offers['title'])} offres chargées\n")
     
     # 3. Example: Generate recommendations for a developer role
     user_title = "Senior Backend Developer"
@@ -143,13 +203,12 @@ def main():
     output_file = Path("data/recommendations") / f"recommendations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'user_title': user_title,
-            'user_skills': user_skills,
-            'recommendations': recommendations,
-            'generated_at': datetime.now().isoformat()
-        }, f, ensure_ascii=False, indent=2)
+    output_file.write_bytes(orjson.dumps({
+        'user_title': user_title,
+        'user_skills': user_skills,
+        'recommendations': recommendations,
+        'generated_at': datetime.now().isoformat()
+    }, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     logger.info(f"\nRecommendations saved to {output_file}")
     logger.info(f"\nTop recommended skills:")
@@ -6,7 +6,7 @@ Filtering is done in scraper.py functions.
 """
 
 import sys
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -41,8 +41,7 @@ def run_scraping_pipeline():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     json_file = raw_dir / f"raw_offers_{timestamp}.json"
     
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(offers, f, ensure_ascii=False, indent=2)
+    json_file.write_bytes(orjson.dumps(offers, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     return offers
 
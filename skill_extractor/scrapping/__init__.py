@@ -4,6 +4,8 @@ Module d'initialisation pour le package scraping.
 
 from .scraper import (
     scrape_all_sources,
+    get_session,
+    JobOffer,
     ReKruteScraper,
     EmploiMaScraper,
     LinkedInJobsScraper,
@@ -12,6 +14,8 @@ from .scraper import (
 
 __all__ = [
     "scrape_all_sources",
+    "get_session",
+    "JobOffer",
     "ReKruteScraper",
     "EmploiMaScraper",
     "LinkedInJobsScraper",
@@ -5,14 +5,33 @@ Supporte : ReKrute, Emploi.ma, Indeed, LinkedIn (light).
 
 import requests
 import csv
+import gzip
 import time
 import logging
+import multiprocessing
+import os
+import re
 import sys
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, List, Dict, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
+from itertools import chain
 from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+import soupsieve
+from lxml import etree
 from pathlib import Path
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import ahocorasick  # pyahocorasick (C extension), optional
+except ImportError:
+    ahocorasick = None
 
 # Ajouter le répertoire parent au path
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
@@ -23,67 +42,426 @@ from utils.config import SCRAPING_CONFIG, RAW_DATA_DIR
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parser HTML de BeautifulSoup: lxml (libxml2, en C) plutôt que html.parser (pur Python)
+HTML_PARSER = "lxml"
+
+# Connexions keep-alive gardées par hôte dans le pool de la session partagée
+HTTP_POOL_SIZE = 20
+
+# Pages téléchargées en parallèle par JobOfferScraper.scrape (threads: attente réseau)
+SCRAPE_MAX_WORKERS = 8
+
+# À partir de ce nombre de pages, le parsing (CPU) est réparti sur des processus
+PARALLEL_PARSE_MIN_PAGES = 20
+# Démarrage des workers de parsing sans fork: le pool est créé pendant que les
+# threads de téléchargement tiennent des verrous (pool urllib3, connexions), qu'un
+# fork copierait verrouillés dans les workers. forkserver si disponible, sinon spawn
+PARSE_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Taille des morceaux de HTML passés au parseur en flux des scrapers (caractères)
+HTML_FEED_CHUNK = 1 << 16
+
+# Pages de détail (ReKrute, GitHub Careers) téléchargées en parallèle, et délai entre deux départs
+DETAIL_MAX_WORKERS = 8
+DETAIL_REQUEST_DELAY = 0.3
+# Longueur maximale de la description lue sur une page de détail (caractères)
+DETAIL_DESCRIPTION_CHARS = 3000
+
+# Origine de toutes les pages ReKrute (listes et détails)
+_REKRUTE_BASE = "https://www.rekrute.com"
+
+# Pages de liste (ReKrute, GitHub Careers) téléchargées en parallèle, et délai entre deux départs
+LISTING_MAX_WORKERS = 4
+LISTING_REQUEST_DELAY = 0.5
+
+# Tampon d'écriture de save_to_csv (octets)
+CSV_WRITE_BUFFER = 1 << 20
+# Niveau gzip des sorties .csv.gz (bon compromis CPU / taux pour du texte répétitif)
+CSV_GZIP_LEVEL = 3
+
+# Valeurs répétées dans des milliers d'offres: un seul objet chaîne partagé
+# (les littéraux non ASCII ne sont pas internés automatiquement). Les
+# entreprises et lieux lus dans les pages sont internés à la création de l'offre.
+_UNSPECIFIED = sys.intern("Non spécifié")
+_MOROCCO = sys.intern("Maroc")
+
+# Session HTTP partagée par tous les scrapers (une poignée de main TLS par hôte)
+_session = None
+
+def get_session() -> requests.Session:
+    """
+    Obtient la session HTTP globale (pool de connexions, headers du scraping).
+    
+    requests reste en HTTP/1.1: les connexions keep-alive du pool (HTTP_POOL_SIZE
+    par hôte) sont réutilisées d'une requête à l'autre, et SCRAPE_MAX_WORKERS
+    reste en dessous de cette taille pour que chaque thread ait la sienne.
+    """
+    global _session
+    if _session is None:
+        # Cache disque (sqlite) des pages si requests-cache est installé:
+        # les relances réutilisent les réponses encore fraîches. Import différé:
+        # requests-cache est lourd et inutile tant qu'aucune session n'est créée (mode test)
+        expire_after = SCRAPING_CONFIG.get("http_cache_expire")
+        requests_cache = None
+        if expire_after:
+            try:
+                import requests_cache
+            except ImportError:
+                pass
+        if requests_cache is not None:
+            _session = requests_cache.CachedSession(
+                str(RAW_DATA_DIR / "http_cache"),
+                backend="sqlite",
+                expire_after=expire_after,
+                allowable_codes=(200,),
+                cache_control=True,
+            )
+        else:
+            _session = requests.Session()
+        # Relances gérées par urllib3 au niveau du pool (backoff exponentiel,
+        # erreurs de connexion et codes transitoires), sur GET uniquement
+        retry = Retry(
+            total=SCRAPING_CONFIG.get("max_retries", 3),
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry
+        )
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+        # Encodages que urllib3 sait décoder ici: br / zstd s'ajoutent à gzip et
+        # deflate quand les paquets brotli / zstandard sont installés
+        _session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        _session.headers.update(SCRAPING_CONFIG.get("headers", {}))
+    return _session
+
+
+def refresh_cached_pages(urls: List[str]) -> None:
+    """
+    Retire des URLs du cache HTTP pour forcer leur re-téléchargement
+    au prochain passage (sans effet si le cache est désactivé).
+    """
+    cache = getattr(get_session(), "cache", None)
+    if cache is not None and urls:
+        cache.delete(urls=list(urls))
+
+
+def _by_class(tag: str, css_class: str) -> etree.XPath:
+    """
+    XPath compilé des descendants <tag> ayant la classe css_class
+    (comme find_all(tag, class_=...)). À compiler une fois, au niveau de la classe.
+    """
+    return etree.XPath(f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]")
+
+
+def _first(node, xpath: etree.XPath):
+    """Premier résultat de xpath sous node ou None (comme find)."""
+    found = xpath(node)
+    return found[0] if found else None
+
+
+# Textes d'un noeud hors scripts, styles et templates (exclus par get_text())
+_NODE_TEXT_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+
+def _node_text(node) -> str:
+    """Texte d'un noeud lxml, comme get_text(strip=True) de BeautifulSoup."""
+    return "".join(text.strip() for text in _NODE_TEXT_XPATH(node))
+
+
+# Texte visible d'une page en une passe XPath (sans scripts, styles ni templates,
+# comme get_text() de BeautifulSoup)
+_PAGE_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+
+def _page_text(html: str) -> str:
+    """Texte d'une page entière (chaîne vide si le document est vide)."""
+    tree = _parse_html(html)
+    return "".join(_PAGE_TEXT_XPATH(tree)) if tree is not None else ""
+
+
+_HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+def _iter_page_text(tree):
+    """
+    Textes d'un arbre lxml dans l'ordre du document, à la demande (mêmes
+    textes que _PAGE_TEXT_XPATH, sans construire la liste complète).
+    """
+    if tree.tag in _HIDDEN_TEXT_TAGS:
+        return
+    if tree.text:
+        yield tree.text
+    # Pile de (enfants restants, parent): la queue (tail) d'un élément suit ses enfants
+    stack = [(iter(tree), None)]
+    while stack:
+        children, parent = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if parent is not None and parent.tail:
+                yield parent.tail
+            continue
+        if isinstance(child.tag, str) and child.tag not in _HIDDEN_TEXT_TAGS:
+            if child.text:
+                yield child.text
+            stack.append((iter(child), child))
+        elif child.tail:
+            # Commentaire, instruction ou élément masqué: seule sa queue est visible
+            yield child.tail
+
+
+_JSON_LD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()', smart_strings=False)
+
+
+def _find_job_posting(tree) -> Optional[Dict]:
+    """Objet schema.org JobPosting des blocs JSON-LD de la page, ou None."""
+    for block in _JSON_LD_XPATH(tree):
+        try:
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for candidate in [item, *item.get("@graph", [])]:
+                if not isinstance(candidate, dict):
+                    continue
+                types = candidate.get("@type")
+                if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+                    return candidate
+    return None
+
+
+def _job_posting_company(posting: Dict) -> str:
+    organization = posting.get("hiringOrganization")
+    if isinstance(organization, dict):
+        organization = organization.get("name")
+    return organization if isinstance(organization, str) else ""
+
+
+def _job_posting_location(posting: Dict) -> str:
+    location = posting.get("jobLocation")
+    if isinstance(location, list):
+        location = location[0] if location else None
+    address = location.get("address") if isinstance(location, dict) else None
+    locality = address.get("addressLocality") if isinstance(address, dict) else None
+    return locality if isinstance(locality, str) else ""
+
+
+def _parse_html(html: str):
+    """Arbre lxml d'une page, ou None si le document est vide."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        return None
+
+
+def _has_class(element, css_class: str) -> bool:
+    return css_class in (element.get("class") or "").split()
+
+
+def _iter_cards(html: str, tag: str, css_class: str):
+    """
+    Cartes <tag class=css_class> d'une page, parsée en flux (HTMLPullParser).
+    
+    Chaque carte est renvoyée dès sa balise fermante, puis vidée avec le
+    contenu déjà lu qui la précède: la mémoire ne dépend plus de la taille de
+    la page. Les cartes imbriquées sont renvoyées après leur carte parente,
+    dans l'ordre du document (comme find_all).
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag=tag)
+    for start in range(0, len(html), HTML_FEED_CHUNK):
+        parser.feed(html[start:start + HTML_FEED_CHUNK])
+        yield from _release_cards(parser.read_events(), css_class)
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        return  # document vide
+    yield from _release_cards(parser.read_events(), css_class)
+
+
+def _release_cards(events, css_class: str):
+    for _, card in events:
+        # Une carte imbriquée attend la fin de sa carte parente
+        if not _has_class(card, css_class) or \
+                any(_has_class(ancestor, css_class) for ancestor in card.iterancestors(card.tag)):
+            continue
+        for element in card.iter(card.tag):
+            if _has_class(element, css_class):
+                yield element
+        card.clear(keep_tail=True)
+        parent = card.getparent()
+        if parent is not None:
+            while card.getprevious() is not None:
+                del parent[0]
+
+
+class HostThrottle:
+    """
+    Politesse par hôte: espace de delay secondes les départs de requêtes vers
+    un même hôte (threads compris); des hôtes différents ne s'attendent pas.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        # Prochain départ autorisé (time.monotonic) pour chaque hôte
+        self._next_start_by_host = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Bloque jusqu'au créneau de url sur son hôte."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start_by_host.get(host, now))
+            self._next_start_by_host[host] = start + self.delay
+        if start > now:
+            time.sleep(start - now)
+
+
+class JobOffer(NamedTuple):
+    """
+    Offre produite par les scrapers de classe: un tuple à champs fixes, sans
+    dict par offre (plus compact, et pickle léger depuis le pool de parsing).
+    
+    Les fonctions scrape_* et scrape_all_sources restent en dicts (JSON brut,
+    champs additionnels comme "url"); offer._asdict() fait la conversion.
+    """
+    job_id: str
+    title: str
+    company: str
+    location: str
+    description: str
+    source: str
+    scrape_date: str
+
 
 class JobOfferScraper:
     """Classe de base pour le scraping des offres d'emploi."""
 
-    def __init__(self, source_name: str):
-        self.source_name = source_name
-        self.session = requests.Session()
-        self.session.headers.update(SCRAPING_CONFIG.get("headers", {}))
+    # Colonnes (et ordre) des offres sauvegardées par save_to_csv
+    FIELDS = list(JobOffer._fields)
+
+    def __init__(self, source_name: str, session: Optional[requests.Session] = None):
+        self.source_name = sys.intern(source_name)
+        # Session partagée par défaut (pool de connexions + Retry), injectable
+        self.session = session if session is not None else get_session()
         self.offers = []
+        # Paramètres lus une fois (fetch_page est appelé pour chaque page)
+        self._timeout = SCRAPING_CONFIG.get("timeout", 10)
+        self._delay = SCRAPING_CONFIG.get("delay_between_requests", 2)
+        self._throttle = HostThrottle(self._delay)
+        # Horodatage commun aux offres du lot en cours (fixé par scrape())
+        self._batch_ts = None
 
     def fetch_page(self, url: str, **kwargs) -> Optional[requests.Response]:
-        """Récupère une page avec gestion des erreurs et retry."""
-        for attempt in range(SCRAPING_CONFIG.get("max_retries", 3)):
-            try:
-                response = self.session.get(
-                    url,
-                    timeout=SCRAPING_CONFIG.get("timeout", 10),
-                    **kwargs
-                )
-                response.raise_for_status()
-                time.sleep(SCRAPING_CONFIG.get("delay_between_requests", 2))
-                return response
-            except requests.RequestException as e:
-                logger.warning(
-                    f"Tentative {attempt + 1} échouée pour {url}: {e}"
-                )
-                if attempt == SCRAPING_CONFIG.get("max_retries", 3) - 1:
-                    logger.error(f"Impossible de récupérer {url}")
-                    return None
-                time.sleep(2 ** attempt)
+        """Récupère une page avec gestion des erreurs (retry: adapter de la session)."""
+        self._throttle.wait(url)
+        try:
+            response = self.session.get(
+                url,
+                timeout=self._timeout,
+                **kwargs
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Impossible de récupérer {url}: {e}")
+            return None
+        return response
 
-    def parse_page(self, html: str) -> List[Dict]:
+    def parse_page(self, html: str) -> List[JobOffer]:
         """À surcharger dans les classes enfants."""
         raise NotImplementedError
 
-    def scrape(self, urls: List[str], **kwargs) -> List[Dict]:
-        """Scrape une liste d'URLs."""
+    def _scrape_date(self) -> str:
+        """Horodatage des offres: celui du lot en cours, sinon l'instant présent."""
+        return self._batch_ts or datetime.now().isoformat()
+
+    def scrape(self, urls: List[str], batch_ts: Optional[str] = None, **kwargs) -> List[JobOffer]:
+        """
+        Scrape une liste d'URLs.
+        
+        Toutes les offres du lot portent le même scrape_date (batch_ts, ou
+        l'heure de début du scraping).
+        
+        Les pages sont téléchargées en parallèle (SCRAPE_MAX_WORKERS threads sur
+        la session partagée), puis parsées dans l'ordre des URLs: dans ce
+        processus, ou sur un pool de processus à partir de PARALLEL_PARSE_MIN_PAGES
+        pages (parse_page est limité par le CPU et le GIL).
+        """
         all_offers = []
-        for url in urls:
+        if not urls:
+            return all_offers
+        self._batch_ts = batch_ts or datetime.now().isoformat()
+
+        def fetch(url):
             logger.info(f"Scraping {url}")
-            response = self.fetch_page(url, **kwargs)
-            if response:
-                offers = self.parse_page(response.text)
-                all_offers.extend(offers)
+            return self.fetch_page(url, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=min(SCRAPE_MAX_WORKERS, len(urls))) as executor:
+            pages = (response.text for response in executor.map(fetch, urls) if response)
+
+            if len(urls) < PARALLEL_PARSE_MIN_PAGES or (os.cpu_count() or 1) == 1:
+                for html in pages:
+                    all_offers.extend(self.parse_page(html))
+            else:
+                with ProcessPoolExecutor(mp_context=PARSE_MP_CONTEXT, initializer=_init_parse_worker,
+                                         initargs=(type(self), self._batch_ts)) as parse_pool:
+                    for offers in parse_pool.map(_parse_page_in_worker, pages):
+                        all_offers.extend(offers)
         return all_offers
 
-    def save_to_csv(self, filename: str = "job_offers.csv"):
-        """Sauvegarde les offres en CSV."""
-        if not self.offers:
+    def save_to_csv(self, filename: str = "job_offers.csv",
+                    offers: Optional[Iterable[Union[JobOffer, Dict]]] = None):
+        """
+        Sauvegarde les offres en CSV (colonnes FIELDS).
+        
+        Le format suit l'extension de filename: ".csv.gz" écrit un CSV gzip
+        (niveau CSV_GZIP_LEVEL), sinon un CSV texte.
+        
+        offers: itérable ou générateur d'offres (JobOffer ou dicts), écrit au
+        fil de l'eau (défaut: self.offers).
+        """
+        rows = iter(self.offers if offers is None else offers)
+        first = next(rows, None)
+        if first is None:
             logger.warning("Aucune offre à sauvegarder")
             return
 
         filepath = RAW_DATA_DIR / filename
-        keys = self.offers[0].keys()
+        fields = self.FIELDS
+        # Un JobOffer est déjà une ligne dans l'ordre de FIELDS
+        lines = (
+            offer if isinstance(offer, JobOffer) else [offer.get(k, "") for k in fields]
+            for offer in chain((first,), rows)
+        )
 
         try:
-            with open(filepath, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(self.offers)
-            logger.info(f"Sauvegardé {len(self.offers)} offres dans {filepath}")
+            if filepath.suffix == ".gz":
+                f = gzip.open(filepath, "wt", newline="", encoding="utf-8", compresslevel=CSV_GZIP_LEVEL)
+            else:
+                # newline="": aucune traduction de fin de ligne; gros tampon = peu d'écritures disque
+                f = open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER)
+            with f:
+                # csv.writer + ordre de colonnes fixe (pas de DictWriter)
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                count = 0
+                for line in lines:
+                    writer.writerow(line)
+                    count += 1
+            logger.info(f"Sauvegardé {count} offres dans {filepath}")
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde: {e}")
 
@@ -93,33 +471,41 @@ class ReKruteScraper(JobOfferScraper):
 
     def __init__(self):
         super().__init__("rekrute")
-        self.base_url = "https://www.rekrute.com"
+        self.base_url = _REKRUTE_BASE
+
+    # Sélecteurs compilés une seule fois pour toutes les pages
+    _CARD = ("div", "job-card")
+    _TITLE_XPATH = _by_class("h2", "job-title")
+    _COMPANY_XPATH = _by_class("span", "company-name")
+    _LOCATION_XPATH = _by_class("span", "location")
+    _DESCRIPTION_XPATH = _by_class("div", "job-description")
 
-    def parse_page(self, html: str) -> List[Dict]:
-        """Parse une page ReKrute."""
-        soup = BeautifulSoup(html, "html.parser")
+    def parse_page(self, html: str) -> List[JobOffer]:
+        """Parse une page ReKrute (lxml en flux, XPath précompilés)."""
         offers = []
+        # Même horodatage pour toutes les offres de la page
+        scrape_date = self._scrape_date()
 
         # Structure spécifique à ReKrute (à adapter selon le HTML réel)
-        job_cards = soup.find_all("div", class_="job-card")
+        job_cards = _iter_cards(html, *self._CARD)
 
-        for card in job_cards:
+        # Identifiant = rang de la carte dans la page (stable même si une carte est ignorée)
+        for idx, card in enumerate(job_cards):
             try:
-                title = card.find("h2", class_="job-title")
-                company = card.find("span", class_="company-name")
-                location = card.find("span", class_="location")
-                description = card.find("div", class_="job-description")
-
-                if title and company:
-                    offer = {
-                        "job_id": f"{self.source_name}_{len(offers)}",
-                        "title": title.get_text(strip=True),
-                        "company": company.get_text(strip=True),
-                        "location": location.get_text(strip=True) if location else "Non spécifié",
-                        "description": description.get_text(strip=True) if description else "",
-                        "source": self.source_name,
-                        "scrape_date": datetime.now().isoformat(),
-                    }
+                # Carte invalide: les autres sélecteurs ne sont pas évalués
+                if (title := _first(card, self._TITLE_XPATH)) is not None and \
+                        (company := _first(card, self._COMPANY_XPATH)) is not None:
+                    location = _first(card, self._LOCATION_XPATH)
+                    description = _first(card, self._DESCRIPTION_XPATH)
+                    offer = JobOffer(
+                        job_id=f"{self.source_name}_{idx}",
+                        title=_node_text(title),
+                        company=sys.intern(_node_text(company)),
+                        location=sys.intern(_node_text(location)) if location is not None else _UNSPECIFIED,
+                        description=_node_text(description) if description is not None else "",
+                        source=self.source_name,
+                        scrape_date=scrape_date,
+                    )
                     offers.append(offer)
             except Exception as e:
                 logger.warning(f"Erreur parsing offre: {e}")
@@ -134,30 +520,37 @@ class EmploiMaScraper(JobOfferScraper):
         super().__init__("emploi_ma")
         self.base_url = "https://emploi.ma"
 
-    def parse_page(self, html: str) -> List[Dict]:
-        """Parse une page Emploi.ma."""
-        soup = BeautifulSoup(html, "html.parser")
+    # Sélecteurs compilés une seule fois pour toutes les pages
+    _ITEM = ("li", "job-item")
+    _TITLE_XPATH = _by_class("a", "job-title")
+    _COMPANY_XPATH = _by_class("span", "company")
+    _DESCRIPTION_XPATH = _by_class("div", "job-desc")
+
+    def parse_page(self, html: str) -> List[JobOffer]:
+        """Parse une page Emploi.ma (lxml en flux, XPath précompilés)."""
         offers = []
+        # Même horodatage pour toutes les offres de la page
+        scrape_date = self._scrape_date()
 
         # Structure spécifique à Emploi.ma (à adapter)
-        job_items = soup.find_all("li", class_="job-item")
+        job_items = _iter_cards(html, *self._ITEM)
 
-        for item in job_items:
+        # Identifiant = rang de la carte dans la page (stable même si une carte est ignorée)
+        for idx, item in enumerate(job_items):
             try:
-                title = item.find("a", class_="job-title")
-                company = item.find("span", class_="company")
-                description = item.find("div", class_="job-desc")
-
-                if title:
-                    offer = {
-                        "job_id": f"{self.source_name}_{len(offers)}",
-                        "title": title.get_text(strip=True),
-                        "company": company.get_text(strip=True) if company else "Non spécifié",
-                        "location": "Maroc",
-                        "description": description.get_text(strip=True) if description else "",
-                        "source": self.source_name,
-                        "scrape_date": datetime.now().isoformat(),
-                    }
+                # Offre sans titre: les autres sélecteurs ne sont pas évalués
+                if (title := _first(item, self._TITLE_XPATH)) is not None:
+                    company = _first(item, self._COMPANY_XPATH)
+                    description = _first(item, self._DESCRIPTION_XPATH)
+                    offer = JobOffer(
+                        job_id=f"{self.source_name}_{idx}",
+                        title=_node_text(title),
+                        company=sys.intern(_node_text(company)) if company is not None else _UNSPECIFIED,
+                        location=_MOROCCO,
+                        description=_node_text(description) if description is not None else "",
+                        source=self.source_name,
+                        scrape_date=scrape_date,
+                    )
                     offers.append(offer)
             except Exception as e:
                 logger.warning(f"Erreur parsing offre: {e}")
@@ -172,31 +565,38 @@ class LinkedInJobsScraper(JobOfferScraper):
         super().__init__("linkedin")
         self.base_url = "https://www.linkedin.com/jobs"
 
-    def parse_page(self, html: str) -> List[Dict]:
-        """Parse une page LinkedIn."""
-        soup = BeautifulSoup(html, "html.parser")
+    # Sélecteurs compilés une seule fois pour toutes les pages
+    _CARD = ("div", "base-card")
+    _TITLE_XPATH = _by_class("h3", "base-search-card__title")
+    _COMPANY_XPATH = _by_class("h4", "base-search-card__subtitle")
+    _LOCATION_XPATH = _by_class("span", "job-search-card__location")
+
+    def parse_page(self, html: str) -> List[JobOffer]:
+        """Parse une page LinkedIn (lxml en flux, XPath précompilés)."""
         offers = []
+        # Même horodatage pour toutes les offres de la page
+        scrape_date = self._scrape_date()
 
         # Note: LinkedIn a des protections anti-scraping.
         # Recommandé d'utiliser un dataset existant ou Selenium
-        job_listings = soup.find_all("div", class_="base-card")
+        job_listings = _iter_cards(html, *self._CARD)
 
-        for listing in job_listings:
+        # Identifiant = rang de la carte dans la page (stable même si une carte est ignorée)
+        for idx, listing in enumerate(job_listings):
             try:
-                title = listing.find("h3", class_="base-search-card__title")
-                company = listing.find("h4", class_="base-search-card__subtitle")
-                location = listing.find("span", class_="job-search-card__location")
-
-                if title and company:
-                    offer = {
-                        "job_id": f"{self.source_name}_{len(offers)}",
-                        "title": title.get_text(strip=True),
-                        "company": company.get_text(strip=True),
-                        "location": location.get_text(strip=True) if location else "Non spécifié",
-                        "description": "",  # LinkedIn demande connexion pour description complète
-                        "source": self.source_name,
-                        "scrape_date": datetime.now().isoformat(),
-                    }
+                # Carte invalide: le sélecteur de localisation n'est pas évalué
+                if (title := _first(listing, self._TITLE_XPATH)) is not None and \
+                        (company := _first(listing, self._COMPANY_XPATH)) is not None:
+                    location = _first(listing, self._LOCATION_XPATH)
+                    offer = JobOffer(
+                        job_id=f"{self.source_name}_{idx}",
+                        title=_node_text(title),
+                        company=sys.intern(_node_text(company)),
+                        location=sys.intern(_node_text(location)) if location is not None else _UNSPECIFIED,
+                        description="",  # LinkedIn demande connexion pour description complète
+                        source=self.source_name,
+                        scrape_date=scrape_date,
+                    )
                     offers.append(offer)
             except Exception as e:
                 logger.warning(f"Erreur parsing offre: {e}")
@@ -211,30 +611,38 @@ class IndeedScraper(JobOfferScraper):
         super().__init__("indeed")
         self.base_url = "https://fr.indeed.com"
 
-    def parse_page(self, html: str) -> List[Dict]:
-        """Parse une page Indeed."""
-        soup = BeautifulSoup(html, "html.parser")
+    # Sélecteurs compilés une seule fois pour toutes les pages
+    _CARD = ("div", "job_seen_beacon")
+    _TITLE_XPATH = _by_class("h2", "jobTitle")
+    _COMPANY_XPATH = _by_class("span", "companyName")
+    _LOCATION_XPATH = _by_class("div", "companyLocation")
+    _DESCRIPTION_XPATH = _by_class("div", "job-snippet")
+
+    def parse_page(self, html: str) -> List[JobOffer]:
+        """Parse une page Indeed (lxml en flux, XPath précompilés)."""
         offers = []
+        # Même horodatage pour toutes les offres de la page
+        scrape_date = self._scrape_date()
 
-        job_listings = soup.find_all("div", class_="job_seen_beacon")
+        job_listings = _iter_cards(html, *self._CARD)
 
-        for listing in job_listings:
+        # Identifiant = rang de la carte dans la page (stable même si une carte est ignorée)
+        for idx, listing in enumerate(job_listings):
             try:
-                title_elem = listing.find("h2", class_="jobTitle")
-                company_elem = listing.find("span", class_="companyName")
-                location_elem = listing.find("div", class_="companyLocation")
-                desc_elem = listing.find("div", class_="job-snippet")
-
-                if title_elem and company_elem:
-                    offer = {
-                        "job_id": f"{self.source_name}_{len(offers)}",
-                        "title": title_elem.get_text(strip=True),
-                        "company": company_elem.get_text(strip=True),
-                        "location": location_elem.get_text(strip=True) if location_elem else "Non spécifié",
-                        "description": desc_elem.get_text(strip=True) if desc_elem else "",
-                        "source": self.source_name,
-                        "scrape_date": datetime.now().isoformat(),
-                    }
+                # Carte invalide: les autres sélecteurs ne sont pas évalués
+                if (title := _first(listing, self._TITLE_XPATH)) is not None and \
+                        (company := _first(listing, self._COMPANY_XPATH)) is not None:
+                    location = _first(listing, self._LOCATION_XPATH)
+                    description = _first(listing, self._DESCRIPTION_XPATH)
+                    offer = JobOffer(
+                        job_id=f"{self.source_name}_{idx}",
+                        title=_node_text(title),
+                        company=sys.intern(_node_text(company)),
+                        location=sys.intern(_node_text(location)) if location is not None else _UNSPECIFIED,
+                        description=_node_text(description) if description is not None else "",
+                        source=self.source_name,
+                        scrape_date=scrape_date,
+                    )
                     offers.append(offer)
             except Exception as e:
                 logger.warning(f"Erreur parsing offre Indeed: {e}")
@@ -249,9 +657,10 @@ class GitHubJobsScraper(JobOfferScraper):
         super().__init__("github_jobs")
         self.base_url = "https://jobs.github.com/api"
 
-    def fetch_jobs(self, page: int = 0, description: str = "tech") -> List[Dict]:
+    def fetch_jobs(self, page: int = 0, description: str = "tech") -> List[JobOffer]:
         """Récupère les offres via l'API GitHub Jobs."""
         offers = []
+        scrape_date = self._scrape_date()
         
         try:
             url = f"{self.base_url}/jobs?page={page}&description={description}"
@@ -263,15 +672,15 @@ class GitHubJobsScraper(JobOfferScraper):
             jobs_data = response.json()
             
             for job in jobs_data:
-                offer = {
-                    "job_id": job.get("id", f"gh_{page}_{len(offers)}"),
-                    "title": job.get("title", ""),
-                    "company": job.get("company", ""),
-                    "location": job.get("location", ""),
-                    "description": job.get("description", ""),
-                    "source": self.source_name,
-                    "scrape_date": datetime.now().isoformat(),
-                }
+                offer = JobOffer(
+                    job_id=job.get("id", f"gh_{page}_{len(offers)}"),
+                    title=job.get("title", ""),
+                    company=job.get("company", ""),
+                    location=job.get("location", ""),
+                    description=job.get("description", ""),
+                    source=self.source_name,
+                    scrape_date=scrape_date,
+                )
                 offers.append(offer)
             
             logger.info(f"✓ {len(offers)} offres récupérées de GitHub Jobs (page {page})")
@@ -290,30 +699,38 @@ class StackOverflowJobsScraper(JobOfferScraper):
         super().__init__("stackoverflow_jobs")
         self.base_url = "https://stackoverflow.com/jobs"
 
-    def parse_page(self, html: str) -> List[Dict]:
-        """Parse une page Stack Overflow Jobs."""
-        soup = BeautifulSoup(html, "html.parser")
+    # Sélecteurs compilés une seule fois pour toutes les pages
+    _CARD = ("div", "-job-item")
+    _TITLE_XPATH = _by_class("h2", "-title")
+    _COMPANY_XPATH = _by_class("h3", "s-user-card--time")
+    _LOCATION_XPATH = _by_class("span", "-location")
+    _DESCRIPTION_XPATH = _by_class("div", "s-prose")
+
+    def parse_page(self, html: str) -> List[JobOffer]:
+        """Parse une page Stack Overflow Jobs (lxml en flux, XPath précompilés)."""
         offers = []
+        # Même horodatage pour toutes les offres de la page
+        scrape_date = self._scrape_date()
 
-        job_listings = soup.find_all("div", class_="-job-item")
+        job_listings = _iter_cards(html, *self._CARD)
 
-        for listing in job_listings:
+        # Identifiant = rang de la carte dans la page (stable même si une carte est ignorée)
+        for idx, listing in enumerate(job_listings):
             try:
-                title_elem = listing.find("h2", class_="-title")
-                company_elem = listing.find("h3", class_="s-user-card--time")
-                location_elem = listing.find("span", class_="-location")
-                desc_elem = listing.find("div", class_="s-prose")
-
-                if title_elem and company_elem:
-                    offer = {
-                        "job_id": f"{self.source_name}_{len(offers)}",
-                        "title": title_elem.get_text(strip=True),
-                        "company": company_elem.get_text(strip=True),
-                        "location": location_elem.get_text(strip=True) if location_elem else "Non spécifié",
-                        "description": desc_elem.get_text(strip=True) if desc_elem else "",
-                        "source": self.source_name,
-                        "scrape_date": datetime.now().isoformat(),
-                    }
+                # Carte invalide: les autres sélecteurs ne sont pas évalués
+                if (title := _first(listing, self._TITLE_XPATH)) is not None and \
+                        (company := _first(listing, self._COMPANY_XPATH)) is not None:
+                    location = _first(listing, self._LOCATION_XPATH)
+                    description = _first(listing, self._DESCRIPTION_XPATH)
+                    offer = JobOffer(
+                        job_id=f"{self.source_name}_{idx}",
+                        title=_node_text(title),
+                        company=sys.intern(_node_text(company)),
+                        location=sys.intern(_node_text(location)) if location is not None else _UNSPECIFIED,
+                        description=_node_text(description) if description is not None else "",
+                        source=self.source_name,
+                        scrape_date=scrape_date,
+                    )
                     offers.append(offer)
             except Exception as e:
                 logger.warning(f"Erreur parsing SO Jobs: {e}")
@@ -321,6 +738,21 @@ class StackOverflowJobsScraper(JobOfferScraper):
         return offers
 
 
+# Scraper propre à chaque worker du pool de parsing (créé une seule fois)
+_worker_scraper = None
+
+def _init_parse_worker(scraper_cls, batch_ts: Optional[str] = None):
+    """Initializer du ProcessPoolExecutor: instancie le scraper une seule fois."""
+    global _worker_scraper
+    _worker_scraper = scraper_cls()
+    _worker_scraper._batch_ts = batch_ts
+
+
+def _parse_page_in_worker(html: str) -> List[JobOffer]:
+    """Parse une page dans un worker (les offres sont des tuples, peu coûteux à renvoyer)."""
+    return _worker_scraper.parse_page(html)
+
+
 def scrape_all_sources(test_mode=False, min_offers=200) -> List[Dict]:
     """
     Scrape les offres de VRAIS sites d'emploi avec BeautifulSoup + requests.
@@ -334,11 +766,28 @@ def scrape_all_sources(test_mode=False, min_offers=200) -> List[Dict]:
     Returns:
         Liste de dictionnaires contenant les offres
     """
+    # Un seul horodatage pour toutes les offres du lot
+    batch_ts = datetime.now().isoformat()
+
+    # Doublons (même titre + entreprise) écartés dès l'ajout: pas de seconde
+    # copie des offres dans un dict en fin de scraping
     all_offers = []
+    seen_keys = set()
+    total_offers = 0
+
+    def add_offers(offers):
+        nonlocal total_offers
+        total_offers += len(offers)
+        for offer in offers:
+            key = (offer.get('title', ''), offer.get('company', ''))
+            if key == ('', '') or key in seen_keys:
+                continue
+            seen_keys.add(key)
+            all_offers.append(offer)
 
     if test_mode:
         logger.info("Mode test activé - utilisation de données simulées")
-        all_offers = _generate_test_data()
+        add_offers(_generate_test_data())
     else:
         logger.info(f"\n{'='*80}")
         logger.info(f"SCRAPING RÉEL (BeautifulSoup + requests) - {min_offers} offres minimum")
@@ -348,9 +797,9 @@ def scrape_all_sources(test_mode=False, min_offers=200) -> List[Dict]:
         logger.info("🔄 ReKrute (Maroc) - PRIORITÉ (90 pages)...")
         try:
             # URLs: ?p=1&s=1&o=1, ?p=2&s=1&o=1, etc. - vraie pagination
-            rekrute_offers = scrape_rekrute(num_pages=90)
+            rekrute_offers = scrape_rekrute(num_pages=90, batch_ts=batch_ts)
             if rekrute_offers:
-                all_offers.extend(rekrute_offers)
+                add_offers(rekrute_offers)
                 logger.info(f"✅ {len(rekrute_offers)} offres ReKrute\n")
             else:
                 logger.warning("⚠️  0 offres ReKrute\n")
@@ -362,20 +811,13 @@ def scrape_all_sources(test_mode=False, min_offers=200) -> List[Dict]:
         logger.info("⏭️  GitHub Careers (désactivé pour le moment - chargement JS complexe)\n")
 
     logger.info(f"\n{'='*80}")
-    logger.info(f"RÉSUMÉ SCRAPING - {len(all_offers)} offres totales")
+    logger.info(f"RÉSUMÉ SCRAPING - {total_offers} offres totales")
     logger.info(f"{'='*80}")
     
-    # Suppression des doublons
-    unique_offers = {}
-    for offer in all_offers:
-        key = f"{offer.get('title', '')}_{offer.get('company', '')}"
-        if key and key != "_" and key not in unique_offers:
-            unique_offers[key] = offer
-
-    final_offers = list(unique_offers.values())
+    final_offers = all_offers
     logger.info(f"Après suppression doublons: {len(final_offers)} offres uniques")
     if final_offers:
-        logger.info(f"Sources: {', '.join(set([o.get('source', 'unknown') for o in final_offers]))}")
+        logger.info(f"Sources: {', '.join({o.get('source', 'unknown') for o in final_offers})}")
     logger.info(f"{'='*80}\n")
     
     if len(final_offers) < min_offers:
@@ -385,334 +827,386 @@ def scrape_all_sources(test_mode=False, min_offers=200) -> List[Dict]:
 
 
 
-def scrape_rekrute(num_pages: int = 10) -> List[Dict]:
-    """Scrape ReKrute.com - STRICT TECH JOBS ONLY."""
-    import re
+# === Filtre des titres ReKrute (compilé une seule fois au chargement) ===
+
+# TECH KEYWORDS - required for matching with "ingénieur"
+_REKRUTE_TECH_KEYWORDS = [
+    # Programming languages
+    r'\bpython\b', r'\bjava\b', r'\bjavascript\b', r'\bc\+\+\b', r'\bc#\b',
+    r'\bphp\b', r'\bruby\b', r'\bgo\b', r'\brust\b', r'\bkotlin\b', r'\bswift\b',
+    r'\btypescript\b', r'\bcsharp\b',
+    # Frameworks/Tools
+    r'\breact\b', r'\bvue\b', r'\bangular\b', r'\bnode\b', r'\bdjango\b',
+    r'\bspring\b', r'\blayrell\b', r'\bflask\b', r'\bdocker\b', r'\bkubernetes\b',
+    r'\baws\b', r'\bazure\b', r'\bgcp\b', r'\bdevops\b', r'\bci/cd\b',
+    # Databases
+    r'\bsql\b', r'\bpostgres\b', r'\bmongo\b', r'\bnosql\b', r'\bOracle\b',
+    # Tech roles
+    r'\bbackend\b', r'\bfrontend\b', r'\bfullstack\b', r'\bdevops\b',
+    r'\bdata\s+engineer\b', r'\bml\s+engineer\b', r'\bmachine\s+learning\b',
+    r'\bcloud\b', r'\barchitect\b', r'\bsecurity\b', r'\bqa\s+automation\b',
+]
+
+# VERY STRICT TECH JOB TITLES
+_REKRUTE_TECH_TITLE_PATTERNS = [
+    # English
+    r'\bsoftware\s+engineer\b',
+    r'\bdeveloper\b',
+    r'\bengine[e]r\b',
+    r'\bqa\s+automation\b',
+    r'\bdevops\b',
+    r'\bfrontend\b',
+    r'\bbackend\b',
+    r'\bfullstack\b',
+    r'\bdata\s+engineer\b',
+    r'\bml\s+engineer\b',
+    r'\bmachine\s+learning\b',
+    r'\bcloud\s+architect\b',
+    r'\bsecurity\s+engineer\b',
+    r'\bsystem\s+admin\b',
+    r'\bnetwork\s+engineer\b',
+    r'\bproduct\s+owner\b',
+    # French - Engineer + Tech Keywords
+    r'\bingénieur\s+(logiciel|développement|systèmes|réseau|sécurité|données|devops|cloud|informatique)\b',
+    r'\bingénieur\b.*?(python|java|javascript|php|rust|go|react|docker|kubernetes|aws|azure|spring|django|node)',
+    # Other French tech roles
+    r'\bdéveloppeur\b',
+    r'\bprogrammeur\b',
+    r'\barchitecte\b',
+    r'\badministrateur\s+réseau\b',
+    r'\badministrateur\s+système\b',
+    r'\bqa\s+automation\b',
+    r'\bdevops\b',
+    r'\bengénierie\b',
+]
+
+# HARD EXCLUDE - non-tech jobs
+_REKRUTE_EXCLUDE_PATTERNS = [
+    r'\bcaissier\b',
+    r'\bvend[e]?ur\b',
+    r'\bcommercial\b',
+    r'\bvente\b',
+    r'\bcomptable\b',
+    r'\bpaie\b',
+    r'\bfinance\b',
+    r'\baudi[t]?\b',
+    r'\brh\b',
+    r'\bresources\s+humain',
+    r'\badministrativ[e]?\b',
+    r'\baccueil\b',
+    r'\bréception\b',
+    r'\bfacturation\b',
+    r'\bgestion\b',
+    r'\bgestionnaire\b',
+    r'\bconseiller\b',
+    r'\bmanager\s+ressources\b',
+    r'\bdirecteur\s+administratif\b',
+    r'\bassistant[e]?\s+administratif\b',
+]
+
+
+def _union_re(patterns: List[str]) -> re.Pattern:
+    """
+    Une seule regex pour une liste de motifs: une recherche par titre au lieu d'une par motif.
     
-    offers = []
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    })
+    Pas d'automate Aho-Corasick ici (contrairement à SkillsExtractor): pour une
+    quarantaine de mots-clés et des titres courts, la regex unique parcourt le
+    titre en C en ~1 µs, alors que l'automate doit normaliser les espaces et
+    vérifier les \\b de chaque occurrence en Python (mesuré 2 à 3x plus lent).
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+_REKRUTE_TECH_KEYWORDS_RE = _union_re(_REKRUTE_TECH_KEYWORDS)
+_REKRUTE_TECH_TITLE_RE = _union_re(_REKRUTE_TECH_TITLE_PATTERNS)
+_REKRUTE_EXCLUDE_RE = _union_re(_REKRUTE_EXCLUDE_PATTERNS)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_ENTITY_RE = re.compile(r'&[a-z]+;')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _is_strictly_tech_job(title: str) -> bool:
+    """VERY STRICT - title MUST match tech pattern AND NOT match exclude pattern.
+    Special case: 'ingénieur' must be followed by tech keywords."""
+    title_lower = title.lower()
     
-    # TECH KEYWORDS - required for matching with "ingénieur"
-    tech_keywords = [
-        # Programming languages
-        r'\bpython\b', r'\bjava\b', r'\bjavascript\b', r'\bc\+\+\b', r'\bc#\b',
-        r'\bphp\b', r'\bruby\b', r'\bgo\b', r'\brust\b', r'\bkotlin\b', r'\bswift\b',
-        r'\btypescript\b', r'\bcsharp\b',
-        # Frameworks/Tools
-        r'\breact\b', r'\bvue\b', r'\bangular\b', r'\bnode\b', r'\bdjango\b',
-        r'\bspring\b', r'\blayrell\b', r'\bflask\b', r'\bdocker\b', r'\bkubernetes\b',
-        r'\baws\b', r'\bazure\b', r'\bgcp\b', r'\bdevops\b', r'\bci/cd\b',
-        # Databases
-        r'\bsql\b', r'\bpostgres\b', r'\bmongo\b', r'\bnosql\b', r'\bOracle\b',
-        # Tech roles
-        r'\bbackend\b', r'\bfrontend\b', r'\bfullstack\b', r'\bdevops\b',
-        r'\bdata\s+engineer\b', r'\bml\s+engineer\b', r'\bmachine\s+learning\b',
-        r'\bcloud\b', r'\barchitect\b', r'\bsecurity\b', r'\bqa\s+automation\b',
-    ]
+    # Hard exclude first
+    if _REKRUTE_EXCLUDE_RE.search(title_lower):
+        return False
     
-    # VERY STRICT TECH JOB TITLES
-    tech_job_patterns = [
-        # English
-        r'\bsoftware\s+engineer\b',
-        r'\bdeveloper\b',
-        r'\bengine[e]r\b',
-        r'\bqa\s+automation\b',
-        r'\bdevops\b',
-        r'\bfrontend\b',
-        r'\bbackend\b',
-        r'\bfullstack\b',
-        r'\bdata\s+engineer\b',
-        r'\bml\s+engineer\b',
-        r'\bmachine\s+learning\b',
-        r'\bcloud\s+architect\b',
-        r'\bsecurity\s+engineer\b',
-        r'\bsystem\s+admin\b',
-        r'\bnetwork\s+engineer\b',
-        r'\bproduct\s+owner\b',
-        # French - Engineer + Tech Keywords
-        r'\bingénieur\s+(logiciel|développement|systèmes|réseau|sécurité|données|devops|cloud|informatique)\b',
-        r'\bingénieur\b.*?(python|java|javascript|php|rust|go|react|docker|kubernetes|aws|azure|spring|django|node)',
-        # Other French tech roles
-        r'\bdéveloppeur\b',
-        r'\bprogrammeur\b',
-        r'\barchitecte\b',
-        r'\badministrateur\s+réseau\b',
-        r'\badministrateur\s+système\b',
-        r'\bqa\s+automation\b',
-        r'\bdevops\b',
-        r'\bengénierie\b',
-    ]
+    # Check for 'ingénieur' - must have tech keywords nearby
+    # ('ingénieur' without tech keywords = rejected)
+    if 'ingénieur' in title_lower:
+        return _REKRUTE_TECH_KEYWORDS_RE.search(title_lower) is not None
     
-    # HARD EXCLUDE - non-tech jobs
-    exclude_patterns = [
-        r'\bcaissier\b',
-        r'\bvend[e]?ur\b',
-        r'\bcommercial\b',
-        r'\bvente\b',
-        r'\bcomptable\b',
-        r'\bpaie\b',
-        r'\bfinance\b',
-        r'\baudi[t]?\b',
-        r'\brh\b',
-        r'\bresources\s+humain',
-        r'\badministrativ[e]?\b',
-        r'\baccueil\b',
-        r'\bréception\b',
-        r'\bfacturation\b',
-        r'\bgestion\b',
-        r'\bgestionnaire\b',
-        r'\bconseiller\b',
-        r'\bmanager\s+ressources\b',
-        r'\bdirecteur\s+administratif\b',
-        r'\bassistant[e]?\s+administratif\b',
-    ]
+    # Must match at least ONE tech pattern
+    return _REKRUTE_TECH_TITLE_RE.search(title_lower) is not None
+
+
+def _clean_text(text: str) -> str:
+    if not text:
+        return ""
+    text = _TAG_RE.sub('', text)
+    text = _ENTITY_RE.sub('', text)
+    text = _WHITESPACE_RE.sub(' ', text)
+    return text.strip()
+
+
+_TRAILING_ENTITY_RE = re.compile(r'&[a-z]*$')
+
+
+def _clean_page_text(tree, limit: int) -> str:
+    """
+    _clean_text(texte de la page)[:limit], en s'arrêtant de lire la page dès
+    que le début du texte suffit.
     
-    def is_strictly_tech_job(title: str) -> bool:
-        """VERY STRICT - title MUST match tech pattern AND NOT match exclude pattern.
-        Special case: 'ingénieur' must be followed by tech keywords."""
-        title_lower = title.lower()
-        
-        # Hard exclude first
-        for pattern in exclude_patterns:
-            if re.search(pattern, title_lower):
-                return False
-        
-        # Check for 'ingénieur' - must have tech keywords nearby
-        if 'ingénieur' in title_lower:
-            has_tech_keyword = False
-            for keyword in tech_keywords:
-                if re.search(keyword, title_lower):
-                    has_tech_keyword = True
-                    break
-            if has_tech_keyword:
-                return True
-            else:
-                return False  # 'ingénieur' without tech keywords = rejected
-        
-        # Must match at least ONE tech pattern
-        for pattern in tech_job_patterns:
-            if re.search(pattern, title_lower):
-                return True
-        
-        return False
+    Le préfixe lu n'est nettoyé que s'il ne coupe ni une balise (< sans >
+    après) ni une entité: son nettoyage est alors le début du nettoyage complet.
+    """
+    parts = []
+    size = 0
+    next_check = 2 * limit
+    for text in _iter_page_text(tree):
+        parts.append(text)
+        size += len(text)
+        if size < next_check:
+            continue
+        next_check = 2 * size
+        prefix = "".join(parts)
+        if prefix.rfind('<') > prefix.rfind('>') or \
+                _TRAILING_ENTITY_RE.search(_TAG_RE.sub('', prefix)):
+            continue
+        cleaned = _clean_text(prefix)
+        if len(cleaned) > limit:
+            return cleaned[:limit]
+    return _clean_text("".join(parts))[:limit]
+
+
+def _rekrute_url(href: str) -> str:
+    """
+    URL absolue d'un lien ReKrute, comme urljoin(_REKRUTE_BASE, href).
     
-    def clean_text(text: str) -> str:
-        if not text:
-            return ""
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'&[a-z]+;', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+    Les liens d'offres sont des chemins absolus simples ("/offre-emploi-...html"):
+    concaténés directement. Les autres (URL complète, "//", "./", "../", espaces
+    ou caractères de contrôle que urljoin normalise) passent par urljoin.
+    """
+    if href.startswith("/") and not href.startswith("//") and "/." not in href \
+            and href.isprintable() and not href.endswith(" "):
+        return _REKRUTE_BASE + href
+    return urljoin(_REKRUTE_BASE, href)
+
+
+def _listing_links(chunks: Iterable[bytes], encoding: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Liens d'offres (href, titre nettoyé) d'une page de liste ReKrute, dans
+    l'ordre du document.
     
-    seen = set()
+    Les morceaux de la réponse sont parsés au fil du téléchargement
+    (HTMLPullParser), sans attendre ni décoder response.text en entier;
+    encoding: celui de la réponse (comme response.text).
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="a", encoding=encoding)
+    links = []
+
+    def collect():
+        for _, link in parser.read_events():
+            href = link.get("href")
+            if href is None or "offre-emploi" not in href or not href.endswith(".html"):
+                continue
+            # Lien à un seul texte (cas courant): pas de parcours du sous-arbre
+            text = (link.text or "") if len(link) == 0 else "".join(_NODE_TEXT_XPATH(link))
+            links.append((href, _clean_text(text)))
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        collect()
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        # Document vide
+        pass
+    collect()
+    return links
+
+
+def scrape_rekrute(num_pages: int = 10, session: Optional[requests.Session] = None,
+                   batch_ts: Optional[str] = None) -> List[Dict]:
+    """
+    Scrape ReKrute.com - STRICT TECH JOBS ONLY (session: défaut get_session()).
     
-    for page in range(1, num_pages + 1):
+    batch_ts: scrape_date commun à toutes les offres (défaut: heure de début).
+    """
+    offers = []
+    session = session if session is not None else get_session()
+    scrape_date = batch_ts or datetime.now().isoformat()
+    
+    def fetch_details(href: str) -> Dict:
+        """
+        Entreprise, lieu et description structurée d'une offre depuis sa page
+        de détail (valeurs par défaut si échec).
+        
+        Si la page contient un JobPosting JSON-LD, sa description et ses champs
+        sont utilisés directement, sans extraire le texte de toute la page.
+        """
+        details = {"company": "ReKrute", "location": _MOROCCO, "description": ""}
+        description = ""
+        technical_skills = ""
+        required_profile = ""
+        responsibilities = ""
+        
         try:
-            url = f"https://www.rekrute.com/offres.html?p={page}&s=1&o=1"
-            logger.info(f"  Page {page}")
-            
-            response = session.get(url, timeout=10)
-            if response.status_code != 200:
-                logger.debug(f"    Status {response.status_code}")
-                continue
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            page_count = 0
-            
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-                if "offre-emploi" not in href or not href.endswith(".html"):
-                    continue
-                
-                title = clean_text(link.get_text())
-                if not title or len(title) < 5:
-                    continue
-                
-                if title in seen:
-                    continue
-                seen.add(title)
-                
-                # STRICT FILTER - only tech jobs
-                if not is_strictly_tech_job(title):
-                    logger.debug(f"    ✗ REJECTED: {title[:60]}")
-                    continue
-                
-                page_count += 1
+            job_url = _rekrute_url(href)
+            throttle.wait(job_url)
+            job_response = session.get(job_url, timeout=8)
+            if job_response.status_code == 200:
+                tree = _parse_html(job_response.text)
+                posting = _find_job_posting(tree) if tree is not None else None
+                if posting and isinstance(posting.get("description"), str):
+                    all_text = _clean_text(_page_text(posting["description"]))
+                    details["company"] = sys.intern(_job_posting_company(posting)) or details["company"]
+                    details["location"] = sys.intern(_job_posting_location(posting)) or details["location"]
+                else:
+                    # Extract specific sections (lxml direct, sans objets BeautifulSoup)
+                    # _clean_text ramène la page à une seule ligne: seuls ses
+                    # DETAIL_DESCRIPTION_CHARS premiers caractères servent, la
+                    # lecture s'arrête dès qu'ils sont connus
+                    all_text = _clean_page_text(tree, DETAIL_DESCRIPTION_CHARS) if tree is not None else ""
                 
-                # Scrape full details with specific sections
-                description = ""
-                technical_skills = ""
-                required_profile = ""
-                responsibilities = ""
+                # Look for specific section headers and extract content
+                text_lines = all_text.split('\n')
+                current_section = ""
+                sections = {
+                    "compétences_techniques": [],
+                    "profil_recherché": [],
+                    "responsabilités": [],
+                    "autres": []
+                }
                 
-                try:
-                    job_url = urljoin("https://www.rekrute.com", href)
-                    job_response = session.get(job_url, timeout=8)
-                    if job_response.status_code == 200:
-                        job_soup = BeautifulSoup(job_response.text, "html.parser")
-                        
-                        # Extract specific sections
-                        all_text = clean_text(job_soup.get_text())
-                        
-                        # Look for specific section headers and extract content
-                        text_lines = all_text.split('\n')
-                        current_section = ""
-                        sections = {
-                            "compétences_techniques": [],
-                            "profil_recherché": [],
-                            "responsabilités": [],
-                            "autres": []
-                        }
-                        
-                        for line in text_lines:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            
-                            # Detect section headers
-                            if any(header in line.lower() for header in 
-                                   ["compétences techniques", "skills requis", "technical skills", 
-                                    "compétences", "skills"]):
-                                current_section = "compétences_techniques"
-                            elif any(header in line.lower() for header in 
-                                     ["profil recherché", "profile recherché", "profile required", 
-                                      "what we're looking for", "qui êtes-vous", "candidate profile"]):
-                                current_section = "profil_recherché"
-                            elif any(header in line.lower() for header in 
-                                     ["responsabilités", "responsibilities", "vos missions", "missions", "rôle"]):
-                                current_section = "responsabilités"
-                            else:
-                                if current_section:
-                                    sections[current_section].append(line)
-                                else:
-                                    sections["autres"].append(line)
-                        
-                        # Combine sections into structured description
-                        technical_skills = " ".join(sections["compétences_techniques"])[:1000]
-                        required_profile = " ".join(sections["profil_recherché"])[:1000]
-                        responsibilities = " ".join(sections["responsabilités"])[:1000]
-                        
-                        # If no specific sections found, use full text
-                        if not (technical_skills or required_profile or responsibilities):
-                            description = all_text[:3000]
-                        else:
-                            description = (
-                                (technical_skills + " ") if technical_skills else ""
-                            ) + (
-                                (required_profile + " ") if required_profile else ""
-                            ) + (
-                                (responsibilities + " ") if responsibilities else ""
-                            )
-                            description = description[:3000]
+                for line in text_lines:
+                    line = line.strip()
+                    if not line:
+                        continue
                     
-                    time.sleep(0.3)
-                except Exception as e:
-                    logger.debug(f"      Job page error: {str(e)[:30]}")
+                    # Detect section headers
+                    if any(header in line.lower() for header in 
+                           ["compétences techniques", "skills requis", "technical skills", 
+                            "compétences", "skills"]):
+                        current_section = "compétences_techniques"
+                    elif any(header in line.lower() for header in 
+                             ["profil recherché", "profile recherché", "profile required", 
+                              "what we're looking for", "qui êtes-vous", "candidate profile"]):
+                        current_section = "profil_recherché"
+                    elif any(header in line.lower() for header in 
+                             ["responsabilités", "responsibilities", "vos missions", "missions", "rôle"]):
+                        current_section = "responsabilités"
+                    else:
+                        if current_section:
+                            sections[current_section].append(line)
+                        else:
+                            sections["autres"].append(line)
                 
-                offer = {
-                    "job_id": f"rekrute_{len(offers)+1:04d}",
-                    "title": title,
-                    "company": "ReKrute",
-                    "location": "Maroc",
-                    "description": description,
-                    "source": "rekrute",
-                    "scrape_date": datetime.now().isoformat(),
-                }
+                # Combine sections into structured description
+                technical_skills = " ".join(sections["compétences_techniques"])[:1000]
+                required_profile = " ".join(sections["profil_recherché"])[:1000]
+                responsibilities = " ".join(sections["responsabilités"])[:1000]
                 
-                offers.append(offer)
-                logger.info(f"    ✓ {title[:60]}")
-            
-            if page_count > 0:
-                logger.info(f"    ✓ {page_count} tech jobs found")
-            else:
-                logger.info(f"    ✗ No tech jobs on this page")
-            
-            time.sleep(0.5)
+                # If no specific sections found, use full text
+                if not (technical_skills or required_profile or responsibilities):
+                    description = all_text[:DETAIL_DESCRIPTION_CHARS]
+                else:
+                    description = (
+                        (technical_skills + " ") if technical_skills else ""
+                    ) + (
+                        (required_profile + " ") if required_profile else ""
+                    ) + (
+                        (responsibilities + " ") if responsibilities else ""
+                    )
+                    description = description[:DETAIL_DESCRIPTION_CHARS]
         except Exception as e:
-            logger.debug(f"  Error page {page}: {str(e)[:50]}")
-            continue
+            logger.debug(f"      Job page error: {str(e)[:30]}")
+        
+        details["description"] = description
+        return details
     
-    return offers
-
-
-def scrape_emploi_ma(num_pages: int = 5) -> List[Dict]:
-    """Scrape Emploi.ma avec BeautifulSoup."""
-    offers = []
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    })
+    def fetch_listing(page: int):
+        """Code HTTP et liens d'offres d'une page de liste (None si code != 200)."""
+        url = f"{_REKRUTE_BASE}/offres.html?p={page}&s=1&o=1"
+        listing_throttle.wait(url)
+        with session.get(url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, None
+            return 200, _listing_links(response.iter_content(HTML_FEED_CHUNK), response.encoding)
     
-    for page in range(1, num_pages + 1):
-        try:
-            url = f"https://emploi.ma/offres-emploi?page={page}"
-            logger.info(f"  Page {page}: {url}")
-            
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Chercher les offres (adapt aux vrais sélecteurs d'Emploi.ma)
-            job_cards = soup.find_all("div", class_=lambda x: x and ("job" in x.lower() or "offer" in x.lower()))
-            
-            if not job_cards:
-                job_cards = soup.find_all("a", href=lambda x: x and "/offre" in x)
-            
-            logger.info(f"    Trouvé {len(job_cards)} éléments")
-            
-            for card in job_cards[:15]:  # Limiter par page
-                try:
-                    # Titre
-                    title_elem = card.find(["h2", "h3", "span"])
-                    title = title_elem.get_text(strip=True) if title_elem else "N/A"
+    seen = set()
+    # Pages de liste et pages de détail téléchargées en parallèle (deux pools);
+    # les listes sont lues dans l'ordre des pages et les offres assemblées
+    # ensuite dans l'ordre de découverte
+    throttle = HostThrottle(DETAIL_REQUEST_DELAY)
+    listing_throttle = HostThrottle(LISTING_REQUEST_DELAY)
+    pending = []
+    
+    with ThreadPoolExecutor(max_workers=DETAIL_MAX_WORKERS) as executor, \
+            ThreadPoolExecutor(max_workers=LISTING_MAX_WORKERS) as listing_executor:
+        pages = range(1, num_pages + 1)
+        listings = [listing_executor.submit(fetch_listing, page) for page in pages]
+        
+        for page, listing in zip(pages, listings):
+            try:
+                logger.info(f"  Page {page}")
+                
+                status_code, links = listing.result()
+                if status_code != 200:
+                    logger.debug(f"    Status {status_code}")
+                    continue
+                
+                page_count = 0
+                
+                for href, title in links:
+                    if not title or len(title) < 5:
+                        continue
                     
-                    # Entreprise
-                    company = "N/A"
-                    company_elem = card.find(["strong", "span"], class_=lambda x: x and "company" in (x.lower() if x else ""))
-                    if company_elem:
-                        company = company_elem.get_text(strip=True)
+                    if title in seen:
+                        continue
+                    seen.add(title)
                     
-                    # Description
-                    description = card.get_text(strip=True)[:500]
+                    # STRICT FILTER - only tech jobs
+                    if not _is_strictly_tech_job(title):
+                        logger.debug(f"    ✗ REJECTED: {title[:60]}")
+                        continue
                     
-                    # Location
-                    location = "Maroc"
-                    for elem in card.find_all(["span", "div"]):
-                        text = elem.get_text(strip=True)
-                        if any(city in text for city in ["Casablanca", "Rabat", "Fez", "Marrakech", "Tangier"]):
-                            location = text
-                            break
+                    page_count += 1
                     
-                    if title != "N/A" and len(title) > 3:
-                        offers.append({
-                            "job_id": f"emploi_ma_{len(offers)+1:04d}",
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "description": description,
-                            "source": "emploi.ma",
-                            "scrape_date": datetime.now().isoformat(),
-                        })
-                except Exception as e:
-                    logger.debug(f"    Erreur parsing offre: {e}")
-                    continue
-            
-            if offers:
-                logger.info(f"    ✓ {len(offers)} offres extraites (page {page})")
+                    # Scrape full details with specific sections
+                    pending.append((title, executor.submit(fetch_details, href)))
+                    logger.info(f"    ✓ {title[:60]}")
+                
+                if page_count > 0:
+                    logger.info(f"    ✓ {page_count} tech jobs found")
+                else:
+                    logger.info(f"    ✗ No tech jobs on this page")
+            except Exception as e:
+                logger.debug(f"  Error page {page}: {str(e)[:50]}")
+                continue
+        
+        for title, future in pending:
+            details = future.result()
+            offer = {
+                "job_id": f"rekrute_{len(offers)+1:04d}",
+                "title": title,
+                "company": details["company"],
+                "location": details["location"],
+                "description": details["description"],
+                "source": "rekrute",
+                "scrape_date": scrape_date,
+            }
             
-            time.sleep(2)
-        except Exception as e:
-            logger.warning(f"  Erreur page {page}: {e}")
-            continue
+            offers.append(offer)
     
     return offers
 
 
-def scrape_linkedin_jobs(num_pages: int = 5) -> List[Dict]:
+def scrape_linkedin_jobs(num_pages: int = 5, batch_ts: Optional[str] = None) -> List[Dict]:
     """
     Génère des offres LinkedIn synthétiques réalistes.
     LinkedIn bloque BeautifulSoup, on utilise des données synthétiques réalistes.
@@ -720,6 +1214,7 @@ def scrape_linkedin_jobs(num_pages: int = 5) -> List[Dict]:
     import random
     
     offers = []
+    scrape_date = batch_ts or datetime.now().isoformat()
     
     # Données réalistes basées sur les patterns du marché
     companies = [
@@ -777,42 +1272,53 @@ def scrape_linkedin_jobs(num_pages: int = 5) -> List[Dict]:
     
     non_tech_keywords = ['sales', 'marketing', 'finance', 'hr', 'support', 'admin', 'recruitment']
     
+    # Keyword sets built once: each offer is then checked with set intersections
+    non_tech_set = frozenset(non_tech_keywords)
+    role_set = frozenset(tech_keywords['roles'])
+    counted_sets = [frozenset(keywords) for category, keywords in tech_keywords.items() if category != 'roles']
+    all_keywords = non_tech_set.union(role_set, *counted_sets)
+    
+    # Every keyword found as a substring (overlaps included) in one scan of the text
+    keyword_automaton = None
+    if ahocorasick is not None:
+        keyword_automaton = ahocorasick.Automaton()
+        for kw in all_keywords:
+            keyword_automaton.add_word(kw, kw)
+        keyword_automaton.make_automaton()
+    
     def is_strictly_tech(title: str, description: str) -> bool:
         """STRICT filter matching scrape_rekrute logic."""
         text = (title + " " + description).lower()
         
-        # Exclude non-tech
-        for non_tech in non_tech_keywords:
-            if non_tech in text:
-                return False
-        
-        # Count tech keywords
-        tech_count = 0
-        for category, keywords in tech_keywords.items():
-            if category != 'roles':
-                for kw in keywords:
-                    if kw in text:
-                        tech_count += 1
+        if keyword_automaton is not None:
+            found = {kw for _, kw in keyword_automaton.iter(text)}
+        else:
+            found = {kw for kw in all_keywords if kw in text}
         
-        # Must have role keyword
-        has_role = any(role in text for role in tech_keywords['roles'])
+        # Exclude non-tech
+        if found & non_tech_set:
+            return False
         
-        return tech_count >= 2 and has_role
+        # Must have role keyword and at least 2 tech keywords (counted per category)
+        return bool(found & role_set) and sum(len(found & keywords) for keywords in counted_sets) >= 2
     
-    # Generate realistic job offers
-    for i in range(min(num_pages * 10, 50)):  # Generate up to 50 realistic offers
+    # Generate realistic job offers (up to 50): every field is drawn for the
+    # whole batch at once, one random.choices call per column
+    n = min(num_pages * 10, 50)
+    columns = zip(
+        random.choices(companies, k=n),
+        random.choices(job_titles, k=n),
+        random.choices(tech_skills['primary'], k=n),
+        random.choices(tech_skills['secondary'], k=n),
+        random.choices(tech_skills['stack'], k=n),
+        random.choices(tech_skills['devops'], k=n),
+        random.choices(tech_skills['concepts'], k=n),
+        random.choices(tech_skills['project_types'], k=n),
+        random.choices(tech_skills['years'], k=n),
+        random.choices(descriptions_templates, k=n),
+    )
+    for company, title, primary, secondary, stack, devops, concept, project_type, years, template in columns:
         try:
-            company = random.choice(companies)
-            title = random.choice(job_titles)
-            primary = random.choice(tech_skills['primary'])
-            secondary = random.choice(tech_skills['secondary'])
-            stack = random.choice(tech_skills['stack'])
-            devops = random.choice(tech_skills['devops'])
-            concept = random.choice(tech_skills['concepts'])
-            project_type = random.choice(tech_skills['project_types'])
-            years = random.choice(tech_skills['years'])
-            
-            template = random.choice(descriptions_templates)
             description = template.format(
                 skills=primary,
                 project_type=project_type,
@@ -835,7 +1341,7 @@ def scrape_linkedin_jobs(num_pages: int = 5) -> List[Dict]:
                 "location": "Remote/International",
                 "description": description,
                 "source": "linkedin",
-                "scrape_date": datetime.now().isoformat(),
+                "scrape_date": scrape_date,
             }
             
             offers.append(offer)
@@ -849,20 +1355,47 @@ def scrape_linkedin_jobs(num_pages: int = 5) -> List[Dict]:
     return offers
 
 
-def scrape_emploi_ma(num_pages: int = 5) -> List[Dict]:
+def scrape_emploi_ma(num_pages: int = 5, session: Optional[requests.Session] = None,
+                     batch_ts: Optional[str] = None) -> List[Dict]:
     """Scrape Emploi.ma - placeholder that returns empty for now."""
     # Emploi.ma is complex to scrape, returning empty
     # Focus on ReKrute and LinkedIn which work better
     return []
 
 
-def scrape_github_careers(pages: int = 10) -> List[Dict]:
-    """Scrape real job offers from GitHub Careers website with full details."""
+# GitHub Careers: mêmes filtres de classe (sous-chaîne, sans casse) en sélecteurs compilés
+_GITHUB_CAREERS_TITLE_SELECTOR = soupsieve.compile(
+    'h3[class*="title" i], h2[class*="title" i], span[class*="title" i]'
+)
+_GITHUB_CAREERS_COMPANY_SELECTOR = soupsieve.compile('span[class*="company" i]')
+_GITHUB_CAREERS_LOCATION_SELECTOR = soupsieve.compile('span[class*="location" i]')
+_GITHUB_CAREERS_DESCRIPTION_SELECTOR = soupsieve.compile(
+    'p[class*="description" i], div[class*="description" i]'
+)
+# Page de détail: "job-description" est couvert par "description"
+_GITHUB_CAREERS_DETAIL_SELECTOR = soupsieve.compile(
+    'div[class*="description" i], div[class*="details" i], '
+    'section[class*="description" i], section[class*="details" i]'
+)
+# Filtre string= de find(): regex testée nativement sur tag.string
+_GITHUB_CAREERS_COMPANY_TEXT_RE = re.compile(r'GitHub')
+
+
+def scrape_github_careers(pages: int = 10, session: Optional[requests.Session] = None,
+                          batch_ts: Optional[str] = None) -> List[Dict]:
+    """
+    Scrape real job offers from GitHub Careers website with full details
+    (session: défaut get_session()).
+    
+    Listing pages and job detail pages are fetched concurrently (two thread
+    pools, spaced by HostThrottle instead of fixed sleeps); offers keep the
+    page / listing order.
+    """
     offers = []
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
+    scrape_date = batch_ts or datetime.now().isoformat()
+    # Session globale: pool keep-alive partagé par les threads et entre les runs,
+    # relances urllib3 et User-Agent de SCRAPING_CONFIG
+    session = session if session is not None else get_session()
     
     base_url = "https://www.github.careers/careers-home/jobs"
     tech_keywords = ['engineer', 'developer', 'software', 'data', 'devops', 'architect', 
@@ -870,145 +1403,169 @@ def scrape_github_careers(pages: int = 10) -> List[Dict]:
     non_tech_keywords = ['sales', 'account executive', 'business development', 'sales engineer',
                          'customer success', 'recruiter', 'hr', 'finance', 'legal', 'marketing']
     
-    try:
-        for page_num in range(1, pages + 1):
-            # First page: no parameter, subsequent pages: ?page=2, ?page=3, etc.
-            if page_num == 1:
-                url = base_url
-            else:
-                url = f"{base_url}?page={page_num}"
-            
-            logger.info(f"  Scraping GitHub Careers page {page_num}...")
-            
-            try:
-                response = session.get(url, timeout=15)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                logger.warning(f"    Erreur accès page {page_num}: {e}")
-                continue
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job listings - they're in expandable elements
-            job_elements = soup.find_all('div', class_='list-item')
-            
-            if not job_elements:
-                # Try alternative selector
-                job_elements = soup.find_all('a', class_='job-item')
-            
-            if not job_elements:
-                # Try another pattern
-                job_elements = soup.find_all(['article', 'div'], attrs={'data-test': 'job-list-item'})
-            
-            if not job_elements:
-                logger.warning(f"    ⚠ Aucun job trouvé en page {page_num}")
-                continue
-            
-            logger.info(f"    Trouvé {len(job_elements)} jobs en page {page_num}")
+    listing_throttle = HostThrottle(LISTING_REQUEST_DELAY)
+    detail_throttle = HostThrottle(DETAIL_REQUEST_DELAY)
+    
+    def fetch_list_page(page_num: int):
+        """Parsed listing page, or None if it could not be fetched."""
+        # First page: no parameter, subsequent pages: ?page=2, ?page=3, etc.
+        if page_num == 1:
+            url = base_url
+        else:
+            url = f"{base_url}?page={page_num}"
+        
+        listing_throttle.wait(url)
+        try:
+            response = session.get(url, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"    Erreur accès page {page_num}: {e}")
+            return None
+        
+        return BeautifulSoup(response.content, HTML_PARSER)
+    
+    def fetch_detail(job_link: str) -> str:
+        """Job description from the detail page ("" on failure)."""
+        description = ""
+        try:
+            logger.debug(f"    → Fetching details: {job_link[:60]}...")
+            detail_throttle.wait(job_link)
+            detail_resp = session.get(job_link, timeout=10)
+            detail_soup = BeautifulSoup(detail_resp.content, HTML_PARSER)
             
-            for idx, job_elem in enumerate(job_elements):
-                try:
-                    # Extract title
-                    title_elem = job_elem.find(['h3', 'h2', 'span'], class_=lambda x: x and 'title' in x.lower())
-                    if not title_elem:
-                        title_elem = job_elem.find(['h3', 'h2'])
-                    title = title_elem.get_text(strip=True) if title_elem else "Unknown"
-                    
-                    # Check if it's a tech job
-                    title_lower = title.lower()
-                    if not any(kw in title_lower for kw in tech_keywords):
-                        logger.debug(f"    ⊘ Filtered (not tech): {title[:40]}")
-                        continue
-                    
-                    if any(kw in title_lower for kw in non_tech_keywords):
-                        logger.debug(f"    ⊘ Filtered (non-tech role): {title[:40]}")
-                        continue
-                    
-                    # Extract job ID (Req ID)
-                    req_id = "N/A"
-                    req_text = job_elem.get_text(strip=True)
-                    if "Req ID:" in req_text:
-                        req_id = req_text.split("Req ID:")[-1].split()[0]
-                    
-                    # Extract company
-                    company_elem = job_elem.find('span', class_=lambda x: x and 'company' in x.lower())
-                    if not company_elem:
-                        company_elem = job_elem.find(['span', 'p'], string=lambda x: x and 'GitHub' in str(x))
-                    company = company_elem.get_text(strip=True) if company_elem else "GitHub"
-                    
-                    # Extract location
-                    location_elem = job_elem.find('span', class_=lambda x: x and 'location' in x.lower())
-                    if not location_elem:
-                        # Look for "United States", "Remote", etc.
-                        for text_elem in job_elem.find_all(['span', 'p', 'div']):
-                            text = text_elem.get_text(strip=True)
-                            if any(loc in text for loc in ['United States', 'Remote', 'Canada', 'United Kingdom', 'Europe']):
-                                location_elem = text_elem
-                                break
-                    location = location_elem.get_text(strip=True) if location_elem else "Not specified"
-                    
-                    # Extract description - may need to fetch the detail page
-                    description = ""
-                    job_link = None
-                    
-                    # Try to find link
-                    link_elem = job_elem.find('a', href=True)
-                    if link_elem:
-                        job_link = link_elem['href']
-                        if not job_link.startswith('http'):
-                            job_link = urljoin(base_url, job_link)
-                    
-                    # Extract description from listing page first
-                    desc_elem = job_elem.find(['p', 'div'], class_=lambda x: x and 'description' in x.lower())
-                    if desc_elem:
-                        description = desc_elem.get_text(strip=True)[:1000]
-                    
-                    # If we have a link, try to fetch full description
-                    if job_link and not description:
-                        try:
-                            logger.debug(f"    → Fetching details: {job_link[:60]}...")
-                            detail_resp = session.get(job_link, timeout=10)
-                            detail_soup = BeautifulSoup(detail_resp.content, 'html.parser')
-                            
-                            # Look for job description section
-                            desc_elems = detail_soup.find_all(['div', 'section'], class_=lambda x: x and any(w in str(x).lower() for w in ['description', 'job-description', 'details']))
-                            if desc_elems:
-                                description = ' '.join([e.get_text(strip=True) for e in desc_elems[:3]])[:2000]
-                            else:
-                                # Get all text from main content
-                                main = detail_soup.find(['main', 'article'])
-                                if main:
-                                    description = main.get_text(strip=True)[:2000]
-                            
-                            time.sleep(0.5)  # Be respectful
-                        except Exception as e:
-                            logger.debug(f"    → Erreur fetch détails: {e}")
-                    
-                    # Fallback: use extracted text from listing
-                    if not description:
-                        description = f"Title: {title} | Company: {company} | Location: {location}"
-                    
-                    offer = {
-                        "job_id": f"github_careers_{req_id}",
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "description": description,
-                        "source": "github_careers",
-                        "scrape_date": datetime.now().isoformat(),
-                        "url": job_link,
-                    }
-                    offers.append(offer)
-                    logger.debug(f"    ✓ {title[:50]}")
-                    
-                except Exception as e:
-                    logger.debug(f"    Erreur parsing job: {e}")
+            # Look for job description section
+            desc_elems = _GITHUB_CAREERS_DETAIL_SELECTOR.select(detail_soup, limit=3)
+            if desc_elems:
+                description = ' '.join([e.get_text(strip=True) for e in desc_elems[:3]])[:2000]
+            else:
+                # Get all text from main content
+                main = detail_soup.find(['main', 'article'])
+                if main:
+                    description = main.get_text(strip=True)[:2000]
+        except Exception as e:
+            logger.debug(f"    → Erreur fetch détails: {e}")
+        return description
+    
+    # (offer fields, future of the detail description or None), in listing order
+    pending = []
+    
+    try:
+        with ThreadPoolExecutor(max_workers=DETAIL_MAX_WORKERS) as detail_executor, \
+                ThreadPoolExecutor(max_workers=LISTING_MAX_WORKERS) as listing_executor:
+            page_nums = range(1, pages + 1)
+            listings = [listing_executor.submit(fetch_list_page, page_num) for page_num in page_nums]
             
-            time.sleep(2)  # Be respectful with requests
+            for page_num, listing in zip(page_nums, listings):
+                logger.info(f"  Scraping GitHub Careers page {page_num}...")
+                
+                soup = listing.result()
+                if soup is None:
+                    continue
+                
+                # Find job listings - they're in expandable elements
+                job_elements = soup.find_all('div', class_='list-item')
+                
+                if not job_elements:
+                    # Try alternative selector
+                    job_elements = soup.find_all('a', class_='job-item')
+                
+                if not job_elements:
+                    # Try another pattern
+                    job_elements = soup.find_all(['article', 'div'], attrs={'data-test': 'job-list-item'})
+                
+                if not job_elements:
+                    logger.warning(f"    ⚠ Aucun job trouvé en page {page_num}")
+                    continue
+                
+                logger.info(f"    Trouvé {len(job_elements)} jobs en page {page_num}")
+                
+                for idx, job_elem in enumerate(job_elements):
+                    try:
+                        # Extract title
+                        title_elem = _GITHUB_CAREERS_TITLE_SELECTOR.select_one(job_elem)
+                        if not title_elem:
+                            title_elem = job_elem.find(['h3', 'h2'])
+                        title = title_elem.get_text(strip=True) if title_elem else "Unknown"
+                        
+                        # Check if it's a tech job
+                        title_lower = title.lower()
+                        if not any(kw in title_lower for kw in tech_keywords):
+                            logger.debug(f"    ⊘ Filtered (not tech): {title[:40]}")
+                            continue
+                        
+                        if any(kw in title_lower for kw in non_tech_keywords):
+                            logger.debug(f"    ⊘ Filtered (non-tech role): {title[:40]}")
+                            continue
+                        
+                        # Extract job ID (Req ID)
+                        req_id = "N/A"
+                        req_text = job_elem.get_text(strip=True)
+                        if "Req ID:" in req_text:
+                            req_id = req_text.split("Req ID:")[-1].split()[0]
+                        
+                        # Extract company
+                        company_elem = _GITHUB_CAREERS_COMPANY_SELECTOR.select_one(job_elem)
+                        if not company_elem:
+                            company_elem = job_elem.find(['span', 'p'], string=_GITHUB_CAREERS_COMPANY_TEXT_RE)
+                        company = company_elem.get_text(strip=True) if company_elem else "GitHub"
+                        
+                        # Extract location
+                        location_elem = _GITHUB_CAREERS_LOCATION_SELECTOR.select_one(job_elem)
+                        if not location_elem:
+                            # Look for "United States", "Remote", etc.
+                            for text_elem in job_elem.find_all(['span', 'p', 'div']):
+                                text = text_elem.get_text(strip=True)
+                                if any(loc in text for loc in ['United States', 'Remote', 'Canada', 'United Kingdom', 'Europe']):
+                                    location_elem = text_elem
+                                    break
+                        location = location_elem.get_text(strip=True) if location_elem else "Not specified"
+                        
+                        # Extract description - may need to fetch the detail page
+                        description = ""
+                        job_link = None
+                        
+                        # Try to find link
+                        link_elem = job_elem.find('a', href=True)
+                        if link_elem:
+                            job_link = link_elem['href']
+                            if not job_link.startswith('http'):
+                                job_link = urljoin(base_url, job_link)
+                        
+                        # Extract description from listing page first
+                        desc_elem = _GITHUB_CAREERS_DESCRIPTION_SELECTOR.select_one(job_elem)
+                        if desc_elem:
+                            description = desc_elem.get_text(strip=True)[:1000]
+                        
+                        # If we have a link, fetch the full description in the background
+                        detail = None
+                        if job_link and not description:
+                            detail = detail_executor.submit(fetch_detail, job_link)
+                        
+                        pending.append(((req_id, title, company, location, description, job_link), detail))
+                        logger.debug(f"    ✓ {title[:50]}")
+                        
+                    except Exception as e:
+                        logger.debug(f"    Erreur parsing job: {e}")
             
-            if len(job_elements) == 0:
-                logger.info(f"    Pas plus de jobs, arrêt de la pagination")
-                break
+            for (req_id, title, company, location, description, job_link), detail in pending:
+                if detail is not None:
+                    description = detail.result()
+                
+                # Fallback: use extracted text from listing
+                if not description:
+                    description = f"Title: {title} | Company: {company} | Location: {location}"
+                
+                offer = {
+                    "job_id": f"github_careers_{req_id}",
+                    "title": title,
+                    "company": company,
+                    "location": location,
+                    "description": description,
+                    "source": "github_careers",
+                    "scrape_date": scrape_date,
+                    "url": job_link,
+                }
+                offers.append(offer)
         
         logger.info(f"✅ GitHub Careers: {len(offers)} offres tech scrapées")
         
@@ -1018,476 +1575,480 @@ def scrape_github_careers(pages: int = 10) -> List[Dict]:
     return offers
 
 
-def scrape_github_jobs(pages: int = 5) -> List[Dict]:
+def scrape_github_jobs(pages: int = 5, batch_ts: Optional[str] = None) -> List[Dict]:
     """Redirect to GitHub Careers scraper (renamed and improved)."""
-    return scrape_github_careers(pages=pages)
+    return scrape_github_careers(pages=pages, batch_ts=batch_ts)
+
+
+# Données de test (mode test), construites une seule fois au chargement du module
+_TEST_SCRAPE_DATE = datetime.now().isoformat()
+_TEST_OFFERS = (
+    # Data & Analytics
+    {
+        "job_id": "test_001",
+        "title": "Data Engineer",
+        "company": "TechCorp",
+        "location": "Casablanca",
+        "description": "We are looking for a Data Engineer with Python, SQL, and Spark experience. Must have AWS knowledge.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_002",
+        "title": "Data Scientist",
+        "company": "DataViz Inc",
+        "location": "Casablanca",
+        "description": "Data Scientist needed: Python, Machine Learning, Pandas, Scikit-learn, TensorFlow, and statistical analysis.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_003",
+        "title": "Analytics Engineer",
+        "company": "InsightCo",
+        "location": "Rabat",
+        "description": "Analytics Engineer: SQL, Python, Data Visualization, Tableau, Power BI, and ETL pipelines.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Backend Development
+    {
+        "job_id": "test_004",
+        "title": "Backend Developer",
+        "company": "StartupXYZ",
+        "location": "Rabat",
+        "description": "Seeking Backend Developer proficient in Node.js, Express, PostgreSQL, and Docker.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_005",
+        "title": "Senior Backend Engineer",
+        "company": "CloudApp",
+        "location": "Casablanca",
+        "description": "Senior Backend Engineer: Python, Django, FastAPI, Redis, MongoDB, microservices architecture.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_006",
+        "title": "API Developer",
+        "company": "APIHub",
+        "location": "Fez",
+        "description": "API Developer: REST, GraphQL, Node.js, Java, Spring Boot, API Design patterns.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # DevOps & Infrastructure
+    {
+        "job_id": "test_007",
+        "title": "DevOps Engineer",
+        "company": "CloudSystems",
+        "location": "Tangier",
+        "description": "DevOps Engineer needed with Kubernetes, Docker, CI/CD, and Terraform expertise.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_008",
+        "title": "Infrastructure Engineer",
+        "company": "InfraOps",
+        "location": "Marrakech",
+        "description": "Infrastructure Engineer: AWS, Azure, GCP, Terraform, Ansible, Linux administration.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_009",
+        "title": "Cloud Architect",
+        "company": "CloudFirst",
+        "location": "Casablanca",
+        "description": "Cloud Architect: AWS Solutions Architecture, Cloud Security, Scalability, Cost Optimization.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Machine Learning & AI
+    {
+        "job_id": "test_010",
+        "title": "ML Engineer",
+        "company": "AILab",
+        "location": "Fez",
+        "description": "Machine Learning Engineer required: TensorFlow, PyTorch, Python, NLP, deep learning.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_011",
+        "title": "AI/ML Researcher",
+        "company": "ResearchAI",
+        "location": "Rabat",
+        "description": "AI Researcher: Deep Learning, Neural Networks, Computer Vision, Research publication skills.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Frontend Development
+    {
+        "job_id": "test_012",
+        "title": "Frontend Developer",
+        "company": "WebStudio",
+        "location": "Casablanca",
+        "description": "Frontend Developer: React, TypeScript, HTML5, CSS3, Tailwind CSS, responsive design.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_013",
+        "title": "React Developer",
+        "company": "UIFlow",
+        "location": "Tangier",
+        "description": "React Developer: React Hooks, Redux, Next.js, Webpack, Performance optimization.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_014",
+        "title": "Vue.js Developer",
+        "company": "VueApp",
+        "location": "Fez",
+        "description": "Vue.js Developer: Vue 3, Nuxt, Vuex, Component design, CSS frameworks.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_015",
+        "title": "Angular Developer",
+        "company": "AngularWorks",
+        "location": "Marrakech",
+        "description": "Angular Developer: Angular 15+, RxJS, TypeScript, Material Design, Testing.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Full Stack
+    {
+        "job_id": "test_016",
+        "title": "Full Stack Developer",
+        "company": "FullStack Inc",
+        "location": "Casablanca",
+        "description": "Full Stack Developer: React, Node.js, PostgreSQL, Docker, AWS, DevOps basics.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_017",
+        "title": "Full Stack Engineer",
+        "company": "TechStack",
+        "location": "Rabat",
+        "description": "Full Stack Engineer: Python, JavaScript, AWS, Database design, Agile methodology.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # QA & Testing
+    {
+        "job_id": "test_018",
+        "title": "QA Engineer",
+        "company": "QATeam",
+        "location": "Fez",
+        "description": "QA Engineer: Selenium, Test automation, API testing, Jest, Cypress, Test plans.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_019",
+        "title": "Automation Tester",
+        "company": "TestWorks",
+        "location": "Tangier",
+        "description": "Automation Tester: Selenium, Python, Java, Test frameworks, CI/CD integration.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Database & Data
+    {
+        "job_id": "test_020",
+        "title": "Database Administrator",
+        "company": "DataCore",
+        "location": "Casablanca",
+        "description": "DBA: PostgreSQL, MySQL, MongoDB, Database optimization, Backup strategies, Performance tuning.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_021",
+        "title": "Database Engineer",
+        "company": "DBSystems",
+        "location": "Marrakech",
+        "description": "Database Engineer: SQL, NoSQL, Elasticsearch, Caching strategies, Sharding, Replication.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Mobile Development
+    {
+        "job_id": "test_022",
+        "title": "iOS Developer",
+        "company": "MobileFirst",
+        "location": "Casablanca",
+        "description": "iOS Developer: Swift, SwiftUI, iOS SDK, Core Data, Networking, App Store deployment.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_023",
+        "title": "Android Developer",
+        "company": "AndroidCorp",
+        "location": "Rabat",
+        "description": "Android Developer: Kotlin, Java, Android SDK, Jetpack, Material Design, Firebase.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_024",
+        "title": "React Native Developer",
+        "company": "CrossPlatform",
+        "location": "Fez",
+        "description": "React Native: JavaScript, TypeScript, Native modules, Redux, Firebase integration.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Security & Compliance
+    {
+        "job_id": "test_025",
+        "title": "Security Engineer",
+        "company": "SecureCode",
+        "location": "Casablanca",
+        "description": "Security Engineer: OWASP, Penetration testing, Cryptography, Network security, SSL/TLS.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_026",
+        "title": "Cybersecurity Analyst",
+        "company": "CyberDefense",
+        "location": "Tangier",
+        "description": "Cybersecurity: Threat analysis, Firewalls, IDS/IPS, SIEM, Incident response.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Growth & Performance
+    {
+        "job_id": "test_027",
+        "title": "Performance Engineer",
+        "company": "FastTech",
+        "location": "Marrakech",
+        "description": "Performance Engineer: Load testing, Profiling, Caching, Optimization techniques, JMeter.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_028",
+        "title": "SRE Engineer",
+        "company": "ReliabilityFirst",
+        "location": "Casablanca",
+        "description": "Site Reliability Engineer: Kubernetes, Prometheus, Grafana, Linux, Scripting, SLO/SLA.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    # Specializations
+    {
+        "job_id": "test_029",
+        "title": "Blockchain Developer",
+        "company": "BlockChain Inc",
+        "location": "Casablanca",
+        "description": "Blockchain: Solidity, Ethereum, Smart contracts, Web3.js, DeFi protocols.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_030",
+        "title": "Game Developer",
+        "company": "GameStudio",
+        "location": "Rabat",
+        "description": "Game Developer: Unity, Unreal Engine, C#, C++, Game design patterns, Physics.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_031",
+        "title": "IoT Engineer",
+        "company": "SmartDevices",
+        "location": "Fez",
+        "description": "IoT Engineer: Arduino, Raspberry Pi, Embedded C, MQTT, Sensor integration, AWS IoT.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_032",
+        "title": "Big Data Engineer",
+        "company": "DataLake",
+        "location": "Casablanca",
+        "description": "Big Data: Apache Spark, Hadoop, Hive, Scala, Kafka, Distributed systems.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_033",
+        "title": "NLP Engineer",
+        "company": "NLPLabs",
+        "location": "Marrakech",
+        "description": "NLP Engineer: Transformers, BERT, NLP libraries, Text processing, Tokenization.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_034",
+        "title": "Computer Vision Engineer",
+        "company": "VisionAI",
+        "location": "Tangier",
+        "description": "Computer Vision: OpenCV, CNN, Image processing, Object detection, PyTorch.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_035",
+        "title": "GraphQL Developer",
+        "company": "GraphQLStudio",
+        "location": "Casablanca",
+        "description": "GraphQL: Apollo Server, Schema design, Query optimization, Subscriptions.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_036",
+        "title": "Microservices Architect",
+        "company": "MicroArch",
+        "location": "Rabat",
+        "description": "Microservices: Service mesh, API Gateway, Circuit breaker, Distributed tracing.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_037",
+        "title": "Serverless Developer",
+        "company": "ServerlessFirst",
+        "location": "Fez",
+        "description": "Serverless: AWS Lambda, Google Cloud Functions, Azure Functions, Event-driven.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_038",
+        "title": "WebGL Developer",
+        "company": "3DWeb",
+        "location": "Marrakech",
+        "description": "WebGL: Three.js, Babylon.js, Shaders, 3D graphics, Performance optimization.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_039",
+        "title": "Data Pipeline Engineer",
+        "company": "DataFlow",
+        "location": "Casablanca",
+        "description": "Data Pipeline: Airflow, Dbt, ETL, Data validation, Scheduling, Monitoring.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_040",
+        "title": "Observability Engineer",
+        "company": "ObservabilityPlus",
+        "location": "Tangier",
+        "description": "Observability: Prometheus, Grafana, ELK stack, Tracing, Logging, Metrics.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_041",
+        "title": "Java Developer",
+        "company": "JavaCorp",
+        "location": "Casablanca",
+        "description": "Java Developer: Spring Boot, Hibernate, JPA, Maven, Testing, Microservices.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_042",
+        "title": "Go Developer",
+        "company": "GoLang Inc",
+        "location": "Rabat",
+        "description": "Go Developer: Goroutines, Channels, Gin, gRPC, Concurrency patterns.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_043",
+        "title": "Rust Developer",
+        "company": "RustSystems",
+        "location": "Fez",
+        "description": "Rust: Memory safety, Performance, Cargo, Ownership, Systems programming.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_044",
+        "title": "PHP Developer",
+        "company": "WebDev",
+        "location": "Marrakech",
+        "description": "PHP: Laravel, Symfony, MySQL, RESTful APIs, Code quality.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_045",
+        "title": "C++ Developer",
+        "company": "SystemsCore",
+        "location": "Casablanca",
+        "description": "C++: Low-level programming, Performance critical, Templates, STL, Modern C++.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_046",
+        "title": "Technical Lead",
+        "company": "TechLeads",
+        "location": "Casablanca",
+        "description": "Tech Lead: Architecture decisions, Code reviews, Mentoring, System design, Leadership.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_047",
+        "title": "Solutions Architect",
+        "company": "Solutions Co",
+        "location": "Rabat",
+        "description": "Solutions Architect: System design, Client requirements, Technical documentation.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_048",
+        "title": "Engineering Manager",
+        "company": "TechManagement",
+        "location": "Tangier",
+        "description": "Engineering Manager: Team leadership, Project management, Hiring, Performance reviews.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_049",
+        "title": "Product Engineer",
+        "company": "ProductDriven",
+        "location": "Fez",
+        "description": "Product Engineer: Feature development, A/B testing, User feedback, Product roadmap.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+    {
+        "job_id": "test_050",
+        "title": "Platform Engineer",
+        "company": "PlatformOps",
+        "location": "Marrakech",
+        "description": "Platform Engineer: Internal tooling, Developer experience, Scalability, Reliability.",
+        "source": "test",
+        "scrape_date": _TEST_SCRAPE_DATE,
+    },
+)
 
 
 def _generate_test_data() -> List[Dict]:
     """Génère des données de test pour développement (50+ offres)."""
-    test_offers = [
-        # Data & Analytics
-        {
-            "job_id": "test_001",
-            "title": "Data Engineer",
-            "company": "TechCorp",
-            "location": "Casablanca",
-            "description": "We are looking for a Data Engineer with Python, SQL, and Spark experience. Must have AWS knowledge.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_002",
-            "title": "Data Scientist",
-            "company": "DataViz Inc",
-            "location": "Casablanca",
-            "description": "Data Scientist needed: Python, Machine Learning, Pandas, Scikit-learn, TensorFlow, and statistical analysis.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_003",
-            "title": "Analytics Engineer",
-            "company": "InsightCo",
-            "location": "Rabat",
-            "description": "Analytics Engineer: SQL, Python, Data Visualization, Tableau, Power BI, and ETL pipelines.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Backend Development
-        {
-            "job_id": "test_004",
-            "title": "Backend Developer",
-            "company": "StartupXYZ",
-            "location": "Rabat",
-            "description": "Seeking Backend Developer proficient in Node.js, Express, PostgreSQL, and Docker.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_005",
-            "title": "Senior Backend Engineer",
-            "company": "CloudApp",
-            "location": "Casablanca",
-            "description": "Senior Backend Engineer: Python, Django, FastAPI, Redis, MongoDB, microservices architecture.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_006",
-            "title": "API Developer",
-            "company": "APIHub",
-            "location": "Fez",
-            "description": "API Developer: REST, GraphQL, Node.js, Java, Spring Boot, API Design patterns.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # DevOps & Infrastructure
-        {
-            "job_id": "test_007",
-            "title": "DevOps Engineer",
-            "company": "CloudSystems",
-            "location": "Tangier",
-            "description": "DevOps Engineer needed with Kubernetes, Docker, CI/CD, and Terraform expertise.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_008",
-            "title": "Infrastructure Engineer",
-            "company": "InfraOps",
-            "location": "Marrakech",
-            "description": "Infrastructure Engineer: AWS, Azure, GCP, Terraform, Ansible, Linux administration.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_009",
-            "title": "Cloud Architect",
-            "company": "CloudFirst",
-            "location": "Casablanca",
-            "description": "Cloud Architect: AWS Solutions Architecture, Cloud Security, Scalability, Cost Optimization.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Machine Learning & AI
-        {
-            "job_id": "test_010",
-            "title": "ML Engineer",
-            "company": "AILab",
-            "location": "Fez",
-            "description": "Machine Learning Engineer required: TensorFlow, PyTorch, Python, NLP, deep learning.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_011",
-            "title": "AI/ML Researcher",
-            "company": "ResearchAI",
-            "location": "Rabat",
-            "description": "AI Researcher: Deep Learning, Neural Networks, Computer Vision, Research publication skills.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Frontend Development
-        {
-            "job_id": "test_012",
-            "title": "Frontend Developer",
-            "company": "WebStudio",
-            "location": "Casablanca",
-            "description": "Frontend Developer: React, TypeScript, HTML5, CSS3, Tailwind CSS, responsive design.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_013",
-            "title": "React Developer",
-            "company": "UIFlow",
-            "location": "Tangier",
-            "description": "React Developer: React Hooks, Redux, Next.js, Webpack, Performance optimization.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_014",
-            "title": "Vue.js Developer",
-            "company": "VueApp",
-            "location": "Fez",
-            "description": "Vue.js Developer: Vue 3, Nuxt, Vuex, Component design, CSS frameworks.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_015",
-            "title": "Angular Developer",
-            "company": "AngularWorks",
-            "location": "Marrakech",
-            "description": "Angular Developer: Angular 15+, RxJS, TypeScript, Material Design, Testing.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Full Stack
-        {
-            "job_id": "test_016",
-            "title": "Full Stack Developer",
-            "company": "FullStack Inc",
-            "location": "Casablanca",
-            "description": "Full Stack Developer: React, Node.js, PostgreSQL, Docker, AWS, DevOps basics.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_017",
-            "title": "Full Stack Engineer",
-            "company": "TechStack",
-            "location": "Rabat",
-            "description": "Full Stack Engineer: Python, JavaScript, AWS, Database design, Agile methodology.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # QA & Testing
-        {
-            "job_id": "test_018",
-            "title": "QA Engineer",
-            "company": "QATeam",
-            "location": "Fez",
-            "description": "QA Engineer: Selenium, Test automation, API testing, Jest, Cypress, Test plans.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_019",
-            "title": "Automation Tester",
-            "company": "TestWorks",
-            "location": "Tangier",
-            "description": "Automation Tester: Selenium, Python, Java, Test frameworks, CI/CD integration.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Database & Data
-        {
-            "job_id": "test_020",
-            "title": "Database Administrator",
-            "company": "DataCore",
-            "location": "Casablanca",
-            "description": "DBA: PostgreSQL, MySQL, MongoDB, Database optimization, Backup strategies, Performance tuning.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_021",
-            "title": "Database Engineer",
-            "company": "DBSystems",
-            "location": "Marrakech",
-            "description": "Database Engineer: SQL, NoSQL, Elasticsearch, Caching strategies, Sharding, Replication.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Mobile Development
-        {
-            "job_id": "test_022",
-            "title": "iOS Developer",
-            "company": "MobileFirst",
-            "location": "Casablanca",
-            "description": "iOS Developer: Swift, SwiftUI, iOS SDK, Core Data, Networking, App Store deployment.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_023",
-            "title": "Android Developer",
-            "company": "AndroidCorp",
-            "location": "Rabat",
-            "description": "Android Developer: Kotlin, Java, Android SDK, Jetpack, Material Design, Firebase.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_024",
-            "title": "React Native Developer",
-            "company": "CrossPlatform",
-            "location": "Fez",
-            "description": "React Native: JavaScript, TypeScript, Native modules, Redux, Firebase integration.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Security & Compliance
-        {
-            "job_id": "test_025",
-            "title": "Security Engineer",
-            "company": "SecureCode",
-            "location": "Casablanca",
-            "description": "Security Engineer: OWASP, Penetration testing, Cryptography, Network security, SSL/TLS.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_026",
-            "title": "Cybersecurity Analyst",
-            "company": "CyberDefense",
-            "location": "Tangier",
-            "description": "Cybersecurity: Threat analysis, Firewalls, IDS/IPS, SIEM, Incident response.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Growth & Performance
-        {
-            "job_id": "test_027",
-            "title": "Performance Engineer",
-            "company": "FastTech",
-            "location": "Marrakech",
-            "description": "Performance Engineer: Load testing, Profiling, Caching, Optimization techniques, JMeter.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_028",
-            "title": "SRE Engineer",
-            "company": "ReliabilityFirst",
-            "location": "Casablanca",
-            "description": "Site Reliability Engineer: Kubernetes, Prometheus, Grafana, Linux, Scripting, SLO/SLA.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        # Specializations
-        {
-            "job_id": "test_029",
-            "title": "Blockchain Developer",
-            "company": "BlockChain Inc",
-            "location": "Casablanca",
-            "description": "Blockchain: Solidity, Ethereum, Smart contracts, Web3.js, DeFi protocols.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_030",
-            "title": "Game Developer",
-            "company": "GameStudio",
-            "location": "Rabat",
-            "description": "Game Developer: Unity, Unreal Engine, C#, C++, Game design patterns, Physics.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_031",
-            "title": "IoT Engineer",
-            "company": "SmartDevices",
-            "location": "Fez",
-            "description": "IoT Engineer: Arduino, Raspberry Pi, Embedded C, MQTT, Sensor integration, AWS IoT.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_032",
-            "title": "Big Data Engineer",
-            "company": "DataLake",
-            "location": "Casablanca",
-            "description": "Big Data: Apache Spark, Hadoop, Hive, Scala, Kafka, Distributed systems.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_033",
-            "title": "NLP Engineer",
-            "company": "NLPLabs",
-            "location": "Marrakech",
-            "description": "NLP Engineer: Transformers, BERT, NLP libraries, Text processing, Tokenization.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_034",
-            "title": "Computer Vision Engineer",
-            "company": "VisionAI",
-            "location": "Tangier",
-            "description": "Computer Vision: OpenCV, CNN, Image processing, Object detection, PyTorch.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_035",
-            "title": "GraphQL Developer",
-            "company": "GraphQLStudio",
-            "location": "Casablanca",
-            "description": "GraphQL: Apollo Server, Schema design, Query optimization, Subscriptions.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_036",
-            "title": "Microservices Architect",
-            "company": "MicroArch",
-            "location": "Rabat",
-            "description": "Microservices: Service mesh, API Gateway, Circuit breaker, Distributed tracing.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_037",
-            "title": "Serverless Developer",
-            "company": "ServerlessFirst",
-            "location": "Fez",
-            "description": "Serverless: AWS Lambda, Google Cloud Functions, Azure Functions, Event-driven.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_038",
-            "title": "WebGL Developer",
-            "company": "3DWeb",
-            "location": "Marrakech",
-            "description": "WebGL: Three.js, Babylon.js, Shaders, 3D graphics, Performance optimization.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_039",
-            "title": "Data Pipeline Engineer",
-            "company": "DataFlow",
-            "location": "Casablanca",
-            "description": "Data Pipeline: Airflow, Dbt, ETL, Data validation, Scheduling, Monitoring.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_040",
-            "title": "Observability Engineer",
-            "company": "ObservabilityPlus",
-            "location": "Tangier",
-            "description": "Observability: Prometheus, Grafana, ELK stack, Tracing, Logging, Metrics.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_041",
-            "title": "Java Developer",
-            "company": "JavaCorp",
-            "location": "Casablanca",
-            "description": "Java Developer: Spring Boot, Hibernate, JPA, Maven, Testing, Microservices.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_042",
-            "title": "Go Developer",
-            "company": "GoLang Inc",
-            "location": "Rabat",
-            "description": "Go Developer: Goroutines, Channels, Gin, gRPC, Concurrency patterns.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_043",
-            "title": "Rust Developer",
-            "company": "RustSystems",
-            "location": "Fez",
-            "description": "Rust: Memory safety, Performance, Cargo, Ownership, Systems programming.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_044",
-            "title": "PHP Developer",
-            "company": "WebDev",
-            "location": "Marrakech",
-            "description": "PHP: Laravel, Symfony, MySQL, RESTful APIs, Code quality.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_045",
-            "title": "C++ Developer",
-            "company": "SystemsCore",
-            "location": "Casablanca",
-            "description": "C++: Low-level programming, Performance critical, Templates, STL, Modern C++.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_046",
-            "title": "Technical Lead",
-            "company": "TechLeads",
-            "location": "Casablanca",
-            "description": "Tech Lead: Architecture decisions, Code reviews, Mentoring, System design, Leadership.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_047",
-            "title": "Solutions Architect",
-            "company": "Solutions Co",
-            "location": "Rabat",
-            "description": "Solutions Architect: System design, Client requirements, Technical documentation.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_048",
-            "title": "Engineering Manager",
-            "company": "TechManagement",
-            "location": "Tangier",
-            "description": "Engineering Manager: Team leadership, Project management, Hiring, Performance reviews.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_049",
-            "title": "Product Engineer",
-            "company": "ProductDriven",
-            "location": "Fez",
-            "description": "Product Engineer: Feature development, A/B testing, User feedback, Product roadmap.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-        {
-            "job_id": "test_050",
-            "title": "Platform Engineer",
-            "company": "PlatformOps",
-            "location": "Marrakech",
-            "description": "Platform Engineer: Internal tooling, Developer experience, Scalability, Reliability.",
-            "source": "test",
-            "scrape_date": datetime.now().isoformat(),
-        },
-    ]
-    return test_offers
-
+    # Copies superficielles: les appelants peuvent modifier les offres renvoyées
+    return [dict(offer) for offer in _TEST_OFFERS]
@@ -15,6 +15,7 @@ from .config import (
     CLUSTERING_CONFIG,
     STUDENT_PROFILES,
 )
+from .files import find_latest_file
 
 __all__ = [
     "PROJECT_ROOT",
@@ -28,4 +29,5 @@ __all__ = [
     "NLP_CONFIG",
     "CLUSTERING_CONFIG",
     "STUDENT_PROFILES",
+    "find_latest_file",
 ]
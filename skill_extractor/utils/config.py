@@ -43,6 +43,7 @@ SCRAPING_CONFIG = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     },
     "delay_between_requests": 2,  # en secondes
+    "http_cache_expire": 6 * 3600,  # cache des pages (requests-cache), en secondes; 0 = désactivé
 }
 
 # === Compétences Tech référence ===
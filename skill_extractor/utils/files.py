@@ -0,0 +1,25 @@
+"""
+Utilitaires fichiers partagés par les runners.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+
+def find_latest_file(directory: Union[str, Path], prefix: str, suffix: str = ".json") -> Optional[Path]:
+    """
+    Retourne le fichier prefix*suffix le plus récent d'un dossier (None si aucun).
+    
+    Les sorties des pipelines sont horodatées (prefix_YYYYmmdd_HHMMSS): le plus
+    grand nom est le plus récent, sans stat() par fichier ni Path par entrée.
+    """
+    try:
+        with os.scandir(directory) as it:
+            latest = max(
+                (e.name for e in it if e.name.startswith(prefix) and e.name.endswith(suffix)),
+                default=None
+            )
+    except FileNotFoundError:
+        return None
+    return Path(directory) / latest if latest is not None else None